@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+
+class FamilyClassification(NamedTuple):
+    """
+    Font family classification (class and subclass ids of the OS/2 sFamilyClass).
+    """
+
+    class_id: int
+    subclass_id: int = 0
+
+    def to_int(
+        self,
+    ) -> int:
+        """
+        Packs the class and subclass ids in a single sFamilyClass value.
+
+        :returns: The sFamilyClass value
+        :rtype: int
+        """
+        return (self.class_id << 8) | (self.subclass_id & 0xFF)
@@ -1,26 +1,29 @@
 from __future__ import annotations
 
-import copy
 import math
 import os
 import re
 import string
-import sys
 import tempfile
+from bisect import bisect_left
 from collections import Counter
-from curses import ascii
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Generator, IO
+from types import MappingProxyType
+from typing import Any, Callable, Generator, IO, Mapping
 import fsutil
 import ots
 from fontTools import unicodedata
 from fontTools.pens.areaPen import AreaPen
 from fontTools.pens.boundsPen import BoundsPen
 from fontTools.pens.svgPathPen import SVGPathPen
+from fontTools.pens.teePen import TeePen
 from fontTools.subset import Options as SubsetterOptions
 from fontTools.subset import Subsetter
-from fontTools.ttLib import TTCollection, TTFont, TTLibError
+from fontTools.ttLib import TTFont, TTLibError
+from fontTools.ttLib.sfnt import readTTCHeader
 from fontTools.varLib import instancer
 from fontTools.varLib.instancer import OverlapMode
 from PIL import Image, ImageDraw, ImageFont
@@ -31,12 +34,15 @@ from fontbro.exceptions import (
     OperationError,
     SanitizationError,
 )
+from fontbro.family_classification import FamilyClassification
 from fontbro.flags import get_flag, set_flag
 from fontbro.math import get_euclidean_distance
 from fontbro.subset import parse_unicodes
 from fontbro.utils import (
+    LazyClassAttribute,
+    cached,
+    clears_cache,
     concat_names,
-    find_item,
     read_json,
     remove_spaces,
     slugify,
@@ -48,10 +54,28 @@ class Font:
     friendly font operations on top of fontTools.
     """
 
+    # Color:
+    _COLOR_TABLES_TAGS: tuple[str, ...] = ("COLR", "CPAL", "CBDT", "CBLC")
+
     # Family Classification:
     # https://learn.microsoft.com/en-us/typography/opentype/spec/ibmfc
-    _FAMILY_CLASSIFICATIONS: dict[str, list[dict[str, Any]]] = read_json(
-        "data/family-classifications.json"
+    _FAMILY_CLASSIFICATIONS: LazyClassAttribute[dict[str, list[dict[str, Any]]]] = (
+        LazyClassAttribute(lambda cls: read_json("data/family-classifications.json"))
+    )
+    # class id -> (class item, subclass id -> subclass item)
+    _FAMILY_CLASSIFICATIONS_BY_ID: LazyClassAttribute[
+        dict[int, tuple[dict[str, Any], dict[int, dict[str, Any]]]]
+    ] = LazyClassAttribute(
+        lambda cls: {
+            class_item["id"]: (
+                class_item,
+                {
+                    subclass_item["id"]: subclass_item
+                    for subclass_item in class_item.get("subclasses", [])
+                },
+            )
+            for class_item in cls._FAMILY_CLASSIFICATIONS["classes"]
+        }
     )
     # fmt: off
     FAMILY_CLASSIFICATION_NO_CLASSIFICATION: dict[str, int] = {'class_id': 0}
@@ -138,10 +162,14 @@ class Font:
     # Features:
     # https://docs.microsoft.com/en-gb/typography/opentype/spec/featurelist
     # https://developer.mozilla.org/en-US/docs/Web/CSS/font-feature-settings
-    _FEATURES_LIST: list[dict[str, Any]] = read_json("data/features.json")
-    _FEATURES_BY_TAG: dict[str, dict[str, Any]] = {
-        feature["tag"]: feature for feature in _FEATURES_LIST
-    }
+    _FEATURES_LIST: LazyClassAttribute[list[dict[str, Any]]] = LazyClassAttribute(
+        lambda cls: read_json("data/features.json")
+    )
+    _FEATURES_BY_TAG: LazyClassAttribute[dict[str, dict[str, Any]]] = (
+        LazyClassAttribute(
+            lambda cls: {feature["tag"]: feature for feature in cls._FEATURES_LIST}
+        )
+    )
 
     # Formats:
     FORMAT_OTF: str = "otf"
@@ -207,651 +235,25 @@ class Font:
         {"id": 24, "key": NAME_DARK_BACKGROUND_PALETTE},
         {"id": 25, "key": NAME_VARIATIONS_POSTSCRIPT_NAME_PREFIX},
     ]
-    _NAMES_BY_ID: dict[int, dict[str, Any]] = {item["id"]: item for item in _NAMES}
-    _NAMES_BY_KEY: dict[str, dict[str, Any]] = {item["key"]: item for item in _NAMES}
+    _NAMES_BY_ID: LazyClassAttribute[dict[int, dict[str, Any]]] = LazyClassAttribute(
+        lambda cls: {item["id"]: item for item in cls._NAMES}
+    )
+    _NAMES_BY_KEY: LazyClassAttribute[dict[str, dict[str, Any]]] = LazyClassAttribute(
+        lambda cls: {item["key"]: item for item in cls._NAMES}
+    )
     _NAMES_MAC_IDS: dict[str, Any] = {"platformID": 3, "platEncID": 1, "langID": 0x409}
     _NAMES_WIN_IDS: dict[str, Any] = {"platformID": 1, "platEncID": 0, "langID": 0x0}
-
-    _NAME_TABLE_LOOKUP = {
-        0: {
-            "name": "Unicode",
-            "encoding": {
-                0: "Unicode 1.0 semantics",
-                1: "Unicode 1.1 semantics",
-                2: "ISO/IEC 10646 semantics",
-                3: "Unicode 2.0 and onwards semantics, Unicode BMP only",
-                4: "Unicode 2.0 and onwards semantics, Unicode full repertoire",
-            },
-            "language": {},
-        },
-        1: {
-            "name": "Macintosh",
-            "encoding": {
-                0: "Roman",
-                1: "Japanese",
-                2: "Traditional Chinese",
-                3: "Korean",
-                4: "Arabic",
-                5: "Hebrew",
-                6: "Greek",
-                7: "Russian",
-                8: "RSymbol",
-                9: "Devanagari",
-                10: "Gurmukhi",
-                11: "Gujarati",
-                12: "Oriya",
-                13: "Bengali",
-                14: "Tamil",
-                15: "Telugu",
-                16: "Kannada",
-                17: "Malayalam",
-                18: "Sinhalese",
-                19: "Burmese",
-                20: "Khmer",
-                21: "Thai",
-                22: "Laotian",
-                23: "Georgian",
-                24: "Armenian",
-                25: "Simplified Chinese",
-                26: "Tibetan",
-                27: "Mongolian",
-                28: "Geez",
-                29: "Slavic",
-                30: "Vietnamese",
-                31: "Sindhi",
-                32: "Uninterpreted",
-            },
-            "language": {
-                0: "English",
-                1: "French",
-                2: "German",
-                3: "Italian",
-                4: "Dutch",
-                5: "Swedish",
-                6: "Spanish",
-                7: "Danish",
-                8: "Portuguese",
-                9: "Norwegian",
-                10: "Hebrew",
-                11: "Japanese",
-                12: "Arabic",
-                13: "Finnish",
-                14: "Greek",
-                15: "Icelandic",
-                16: "Maltese",
-                17: "Turkish",
-                18: "Croatian",
-                19: "Chinese (traditional)",
-                20: "Urdu",
-                21: "Hindi",
-                22: "Thai",
-                23: "Korean",
-                24: "Lithuanian",
-                25: "Polish",
-                26: "Hungarian",
-                27: "Estonian",
-                28: "Latvian",
-                29: "Sami",
-                30: "Faroese",
-                31: "Farsi/Persian",
-                32: "Russian",
-                33: "Chinese (simplified)",
-                34: "Flemish",
-                35: "Irish Gaelic",
-                36: "Albanian",
-                37: "Romanian",
-                38: "Czech",
-                39: "Slovak",
-                40: "Slovenian",
-                41: "Yiddish",
-                42: "Serbian",
-                43: "Macedonian",
-                44: "Bulgarian",
-                45: "Ukrainian",
-                46: "Byelorussian",
-                47: "Uzbek",
-                48: "Kazakh",
-                49: "Azerbaijani (Cyrillic script)",
-                50: "Azerbaijani (Arabic script)",
-                51: "Armenian",
-                52: "Georgian",
-                53: "Moldavian",
-                54: "Kirghiz",
-                55: "Tajiki",
-                56: "Turkmen",
-                57: "Mongolian (Mongolian script)",
-                58: "Mongolian (Cyrillic script)",
-                59: "Pashto",
-                60: "Kurdish",
-                61: "Kashmiri",
-                62: "Sindhi",
-                63: "Tibetan",
-                64: "Nepali",
-                65: "Sanskrit",
-                66: "Marathi",
-                67: "Bengali",
-                68: "Assamese",
-                69: "Gujarati",
-                70: "Punjabi",
-                71: "Oriya",
-                72: "Malayalam",
-                73: "Kannada",
-                74: "Tamil",
-                75: "Telugu",
-                76: "Sinhalese",
-                77: "Burmese",
-                78: "Khmer",
-                79: "Lao",
-                80: "Vietnamese",
-                81: "Indonesian",
-                82: "Tagalog",
-                83: "Malay (Roman script)",
-                84: "Malay (Arabic script)",
-                85: "Amharic",
-                86: "Tigrinya",
-                87: "Galla",
-                88: "Somali",
-                89: "Swahili",
-                90: "Kinyarwanda/Ruanda",
-                91: "Rundi",
-                92: "Nyanja/Chewa",
-                93: "Malagasy",
-                94: "Esperanto",
-                128: "Welsh",
-                129: "Basque",
-                130: "Catalan",
-                131: "Latin",
-                132: "Quechua",
-                133: "Guarani",
-                134: "Aymara",
-                135: "Tatar",
-                136: "Uighur",
-                137: "Dzongkha",
-                138: "Javanese (Roman script)",
-                139: "Sundanese (Roman script)",
-                140: "Galician",
-                141: "Afrikaans",
-                142: "Breton",
-                143: "Inuktitut",
-                144: "Scottish Gaelic",
-                145: "Manx Gaelic",
-                146: "Irish Gaelic (with dot above)",
-                147: "Tongan",
-                148: "Greek (polytonic)",
-                149: "Greenlandic",
-                150: "Azerbaijani (Roman script)",
-            },
-        },
-        3: {
-            "name": "Windows",
-            "encoding": {
-                0: "Symbol",
-                1: "Unicode BMP",
-                2: "ShiftJIS",
-                3: "PRC",
-                4: "Big5",
-                5: "Wansung",
-                6: "Johab",
-                10: "Unicode UCS-4",
-            },
-            "language": {
-                0x0001: "ar",
-                0x0002: "bg",
-                0x0003: "ca",
-                0x0004: "zh-Hans",
-                0x0005: "cs",
-                0x0006: "da",
-                0x0007: "de",
-                0x0008: "el",
-                0x0009: "en",
-                0x000A: "es",
-                0x000B: "fi",
-                0x000C: "fr",
-                0x000D: "he",
-                0x000E: "hu",
-                0x000F: "is",
-                0x0010: "it",
-                0x0011: "ja",
-                0x0012: "ko",
-                0x0013: "nl",
-                0x0014: "no",
-                0x0015: "pl",
-                0x0016: "pt",
-                0x0017: "rm",
-                0x0018: "ro",
-                0x0019: "ru",
-                0x001A: "hr",
-                0x001B: "sk",
-                0x001C: "sq",
-                0x001D: "sv",
-                0x001E: "th",
-                0x001F: "tr",
-                0x0020: "ur",
-                0x0021: "id",
-                0x0022: "uk",
-                0x0023: "be",
-                0x0024: "sl",
-                0x0025: "et",
-                0x0026: "lv",
-                0x0027: "lt",
-                0x0028: "tg",
-                0x0029: "fa",
-                0x002A: "vi",
-                0x002B: "hy",
-                0x002C: "az",
-                0x002D: "eu",
-                0x002E: "hsb",
-                0x002F: "mk",
-                0x0030: "st",
-                0x0031: "ts",
-                0x0032: "tn",
-                0x0033: "ve",
-                0x0034: "xh",
-                0x0035: "zu",
-                0x0036: "af",
-                0x0037: "ka",
-                0x0038: "fo",
-                0x0039: "hi",
-                0x003A: "mt",
-                0x003B: "se",
-                0x003C: "ga",
-                0x003D: "yi",
-                0x003E: "ms",
-                0x003F: "kk",
-                0x0040: "ky",
-                0x0041: "sw",
-                0x0042: "tk",
-                0x0043: "uz",
-                0x0044: "tt",
-                0x0045: "bn",
-                0x0046: "pa",
-                0x0047: "gu",
-                0x0048: "or",
-                0x0049: "ta",
-                0x004A: "te",
-                0x004B: "kn",
-                0x004C: "ml",
-                0x004D: "as",
-                0x004E: "mr",
-                0x004F: "sa",
-                0x0050: "mn",
-                0x0051: "bo",
-                0x0052: "cy",
-                0x0053: "km",
-                0x0054: "lo",
-                0x0055: "my",
-                0x0056: "gl",
-                0x0057: "kok",
-                0x0058: "mni",
-                0x0059: "sd",
-                0x005A: "syr",
-                0x005B: "si",
-                0x005C: "chr",
-                0x005D: "iu",
-                0x005E: "am",
-                0x005F: "tzm",
-                0x0060: "ks",
-                0x0061: "ne",
-                0x0062: "fy",
-                0x0063: "ps",
-                0x0064: "fil",
-                0x0065: "dv",
-                0x0066: "bin",
-                0x0067: "ff",
-                0x0068: "ha",
-                0x0069: "ibb",
-                0x006A: "yo",
-                0x006B: "quz",
-                0x006C: "nso",
-                0x006D: "ba",
-                0x006E: "lb",
-                0x006F: "kl",
-                0x0070: "ig",
-                0x0071: "kr",
-                0x0072: "om",
-                0x0073: "ti",
-                0x0074: "gn",
-                0x0075: "haw",
-                0x0076: "la",
-                0x0077: "so",
-                0x0078: "ii",
-                0x0079: "pap",
-                0x007A: "arn",
-                0x007C: "moh",
-                0x007E: "br",
-                0x0080: "ug",
-                0x0081: "mi",
-                0x0082: "oc",
-                0x0083: "co",
-                0x0084: "gsw",
-                0x0085: "sah",
-                0x0086: "qut",
-                0x0087: "rw",
-                0x0088: "wo",
-                0x008C: "prs",
-                0x0091: "gd",
-                0x0092: "ku",
-                0x0093: "quc",
-                0x0401: "ar-SA",
-                0x0402: "bg-BG",
-                0x0403: "ca-ES",
-                0x0404: "zh-TW",
-                0x0405: "cs-CZ",
-                0x0406: "da-DK",
-                0x0407: "de-DE",
-                0x0408: "el-GR",
-                0x0409: "en-US",
-                0x040A: "es-ES_tradnl",
-                0x040B: "fi-FI",
-                0x040C: "fr-FR",
-                0x040D: "he-IL",
-                0x040E: "hu-HU",
-                0x040F: "is-IS",
-                0x0410: "it-IT",
-                0x0411: "ja-JP",
-                0x0412: "ko-KR",
-                0x0413: "nl-NL",
-                0x0414: "nb-NO",
-                0x0415: "pl-PL",
-                0x0416: "pt-BR",
-                0x0417: "rm-CH",
-                0x0418: "ro-RO",
-                0x0419: "ru-RU",
-                0x041A: "hr-HR",
-                0x041B: "sk-SK",
-                0x041C: "sq-AL",
-                0x041D: "sv-SE",
-                0x041E: "th-TH",
-                0x041F: "tr-TR",
-                0x0420: "ur-PK",
-                0x0421: "id-ID",
-                0x0422: "uk-UA",
-                0x0423: "be-BY",
-                0x0424: "sl-SI",
-                0x0425: "et-EE",
-                0x0426: "lv-LV",
-                0x0427: "lt-LT",
-                0x0428: "tg-Cyrl-TJ",
-                0x0429: "fa-IR",
-                0x042A: "vi-VN",
-                0x042B: "hy-AM",
-                0x042C: "az-Latn-AZ",
-                0x042D: "eu-ES",
-                0x042E: "hsb-DE",
-                0x042F: "mk-MK",
-                0x0430: "st-ZA",
-                0x0431: "ts-ZA",
-                0x0432: "tn-ZA",
-                0x0433: "ve-ZA",
-                0x0434: "xh-ZA",
-                0x0435: "zu-ZA",
-                0x0436: "af-ZA",
-                0x0437: "ka-GE",
-                0x0438: "fo-FO",
-                0x0439: "hi-IN",
-                0x043A: "mt-MT",
-                0x043B: "se-NO",
-                0x043D: "yi-001",
-                0x043E: "ms-MY",
-                0x043F: "kk-KZ",
-                0x0440: "ky-KG",
-                0x0441: "sw-KE",
-                0x0442: "tk-TM",
-                0x0443: "uz-Latn-UZ",
-                0x0444: "tt-RU",
-                0x0445: "bn-IN",
-                0x0446: "pa-IN",
-                0x0447: "gu-IN",
-                0x0448: "or-IN",
-                0x0449: "ta-IN",
-                0x044A: "te-IN",
-                0x044B: "kn-IN",
-                0x044C: "ml-IN",
-                0x044D: "as-IN",
-                0x044E: "mr-IN",
-                0x044F: "sa-IN",
-                0x0450: "mn-MN",
-                0x0451: "bo-CN",
-                0x0452: "cy-GB",
-                0x0453: "km-KH",
-                0x0454: "lo-LA",
-                0x0455: "my-MM",
-                0x0456: "gl-ES",
-                0x0457: "kok-IN",
-                0x0458: "mni-IN",
-                0x0459: "sd-Deva-IN",
-                0x045A: "syr-SY",
-                0x045B: "si-LK",
-                0x045C: "chr-Cher-US",
-                0x045D: "iu-Cans-CA",
-                0x045E: "am-ET",
-                0x045F: "tzm-Arab-MA",
-                0x0460: "ks-Arab",
-                0x0461: "ne-NP",
-                0x0462: "fy-NL",
-                0x0463: "ps-AF",
-                0x0464: "fil-PH",
-                0x0465: "dv-MV",
-                0x0466: "bin-NG",
-                0x0467: "ff-NG",
-                0x0468: "ha-Latn-NG",
-                0x0469: "ibb-NG",
-                0x046A: "yo-NG",
-                0x046B: "quz-BO",
-                0x046C: "nso-ZA",
-                0x046D: "ba-RU",
-                0x046E: "lb-LU",
-                0x046F: "kl-GL",
-                0x0470: "ig-NG",
-                0x0471: "kr-Latn-NG",
-                0x0472: "om-ET",
-                0x0473: "ti-ET",
-                0x0474: "gn-PY",
-                0x0475: "haw-US",
-                0x0476: "la-VA",
-                0x0477: "so-SO",
-                0x0478: "ii-CN",
-                0x0479: "pap-029",
-                0x047A: "arn-CL",
-                0x047C: "moh-CA",
-                0x047E: "br-FR",
-                0x0480: "ug-CN",
-                0x0481: "mi-NZ",
-                0x0482: "oc-FR",
-                0x0483: "co-FR",
-                0x0484: "gsw-FR",
-                0x0485: "sah-RU",
-                0x0486: "qut-GT",
-                0x0487: "rw-RW",
-                0x0488: "wo-SN",
-                0x048C: "prs-AF",
-                0x048D: "plt-MG",
-                0x048E: "zh-yue-HK",
-                0x048F: "tdd-Tale-CN",
-                0x0490: "khb-Talu-CN",
-                0x0491: "gd-GB",
-                0x0492: "ku-Arab-IQ",
-                0x0493: "quc-CO",
-                0x0501: "qps-ploc",
-                0x05FE: "qps-ploca",
-                0x0801: "ar-IQ",
-                0x0803: "ca-ES-valencia",
-                0x0804: "zh-CN",
-                0x0807: "de-CH",
-                0x0809: "en-GB",
-                0x080A: "es-MX",
-                0x080C: "fr-BE",
-                0x0810: "it-CH",
-                0x0811: "ja-Ploc-JP",
-                0x0813: "nl-BE",
-                0x0814: "nn-NO",
-                0x0816: "pt-PT",
-                0x0818: "ro-MD",
-                0x0819: "ru-MD",
-                0x081A: "sr-Latn-CS",
-                0x081D: "sv-FI",
-                0x0820: "ur-IN",
-                0x082C: "az-Cyrl-AZ",
-                0x082E: "dsb-DE",
-                0x0832: "tn-BW",
-                0x083B: "se-SE",
-                0x083C: "ga-IE",
-                0x083E: "ms-BN",
-                0x083F: "kk-Latn-KZ",
-                0x0843: "uz-Cyrl-UZ",
-                0x0845: "bn-BD",
-                0x0846: "pa-Arab-PK",
-                0x0849: "ta-LK",
-                0x0850: "mn-Mong-CN",
-                0x0851: "bo-BT",
-                0x0859: "sd-Arab-PK",
-                0x085D: "iu-Latn-CA",
-                0x085F: "tzm-Latn-DZ",
-                0x0860: "ks-Deva-IN",
-                0x0861: "ne-IN",
-                0x0867: "ff-Latn-SN",
-                0x086B: "quz-EC",
-                0x0873: "ti-ER",
-                0x09FF: "qps-plocm",
-                0x0C01: "ar-EG",
-                0x0C04: "zh-HK",
-                0x0C07: "de-AT",
-                0x0C09: "en-AU",
-                0x0C0A: "es-ES",
-                0x0C0C: "fr-CA",
-                0x0C1A: "sr-Cyrl-CS",
-                0x0C3B: "se-FI",
-                0x0C50: "mn-Mong-MN",
-                0x0C51: "dz-BT",
-                0x0C5F: "tmz-MA",
-                0x0C6B: "quz-PE",
-                0x1001: "ar-LY",
-                0x1004: "zh-SG",
-                0x1007: "de-LU",
-                0x1009: "en-CA",
-                0x100A: "es-GT",
-                0x100C: "fr-CH",
-                0x101A: "hr-BA",
-                0x103B: "smj-NO",
-                0x105F: "tzm-Tfng-MA",
-                0x1401: "ar-DZ",
-                0x1404: "zh-MO",
-                0x1407: "de-LI",
-                0x1409: "en-NZ",
-                0x140A: "es-CR",
-                0x140C: "fr-LU",
-                0x141A: "bs-Latn-BA",
-                0x143B: "smj-SE",
-                0x1801: "ar-MA",
-                0x1809: "en-IE",
-                0x180A: "es-PA",
-                0x180C: "fr-MC",
-                0x181A: "sr-Latn-BA",
-                0x183B: "sma-NO",
-                0x1C01: "ar-TN",
-                0x1C09: "en-ZA",
-                0x1C0A: "es-DO",
-                0x1C0C: "fr-029",
-                0x1C1A: "sr-Cyrl-BA",
-                0x1C3B: "sma-SE",
-                0x2001: "ar-OM",
-                0x2009: "en-JM",
-                0x200A: "es-VE",
-                0x200C: "fr-RE",
-                0x201A: "bs-Cyrl-BA",
-                0x203B: "sms-FI",
-                0x2401: "ar-YE",
-                0x2409: "en-029",
-                0x240A: "es-CO",
-                0x240C: "fr-CD",
-                0x241A: "sr-Latn-RS",
-                0x243B: "smn-FI",
-                0x2801: "ar-SY",
-                0x2809: "en-BZ",
-                0x280A: "es-PE",
-                0x280C: "fr-SN",
-                0x281A: "sr-Cyrl-RS",
-                0x2C01: "ar-JO",
-                0x2C09: "en-TT",
-                0x2C0A: "es-AR",
-                0x2C0C: "fr-CM",
-                0x2C1A: "sr-Latn-ME",
-                0x3001: "ar-LB",
-                0x3009: "en-ZW",
-                0x300A: "es-EC",
-                0x300C: "fr-CI",
-                0x301A: "sr-Cyrl-ME",
-                0x3401: "ar-KW",
-                0x3409: "en-PH",
-                0x340A: "es-CL",
-                0x340C: "fr-ML",
-                0x3801: "ar-AE",
-                0x3809: "en-ID",
-                0x380A: "es-UY",
-                0x380C: "fr-MA",
-                0x3C01: "ar-BH",
-                0x3C09: "en-HK",
-                0x3C0A: "es-PY",
-                0x3C0C: "fr-HT",
-                0x4001: "ar-QA",
-                0x4009: "en-IN",
-                0x400A: "es-BO",
-                0x4401: "ar-Ploc-SA",
-                0x4409: "en-MY",
-                0x440A: "es-SV",
-                0x4801: "ar-145",
-                0x4809: "en-SG",
-                0x480A: "es-HN",
-                0x4C09: "en-AE",
-                0x4C0A: "es-NI",
-                0x5009: "en-BH",
-                0x500A: "es-PR",
-                0x5409: "en-EG",
-                0x540A: "es-US",
-                0x5809: "en-JO",
-                0x580A: "es-419",
-                0x5C09: "en-KW",
-                0x5C0A: "es-CU",
-                0x6009: "en-TR",
-                0x6409: "en-YE",
-                0x641A: "bs-Cyrl",
-                0x681A: "bs-Latn",
-                0x6C1A: "sr-Cyrl",
-                0x701A: "sr-Latn",
-                0x703B: "smn",
-                0x742C: "az-Cyrl",
-                0x743B: "sms",
-                0x7804: "zh",
-                0x7814: "nn",
-                0x781A: "bs",
-                0x782C: "az-Latn",
-                0x783B: "sma",
-                0x783F: "kk-Cyrl",
-                0x7843: "uz-Cyrl",
-                0x7850: "mn-Cyrl",
-                0x785D: "iu-Cans",
-                0x785F: "tzm-Tfng",
-                0x7C04: "zh-Hant",
-                0x7C14: "nb",
-                0x7C1A: "sr",
-                0x7C28: "tg-Cyrl",
-                0x7C2E: "dsb",
-                0x7C3B: "smj",
-                0x7C3F: "kk-Latn",
-                0x7C43: "uz-Latn",
-                0x7C46: "pa-Arab",
-                0x7C50: "mn-Mong",
-                0x7C59: "sd-Arab",
-                0x7C5C: "chr-Cher",
-                0x7C5D: "iu-Latn",
-                0x7C5F: "tzm-Latn",
-                0x7C67: "ff-Latn",
-                0x7C68: "ha-Latn",
-                0x7C92: "ku-Arab",
-                0xE40C: "fr-015",
-            }
-        }
-    }
+    # platforms / encodings / languages lookup is loaded lazily on first use,
+    # see _get_name_table_lookup (data/name-table-lookup.json)
+    # rename patterns:
+    _RENAME_ITALIC_SUFFIX_RE: re.Pattern[str] = re.compile(r"\ italic$", re.IGNORECASE)
+    # keep only printable ASCII subset in postscript name:
+    # https://learn.microsoft.com/en-us/typography/opentype/spec/name#name-ids
+    # !"#$&'*+,-.0123456789:;=?@ABCDEFGHIJKLMNOPQRSTUVWXYZ\^_`abcdefghijklmnopqrstuvwxyz|~
+    _POSTSCRIPT_NAME_DISALLOWED_CHARS_RE: re.Pattern[str] = re.compile(
+        r"[^0-9A-Za-z\!\"\#\$\&\'\*\+\,\-\.\:\;\=\?\@\\\^\_\`\|\~]"
+    )
+    _POSTSCRIPT_NAME_HYPHENS_RE: re.Pattern[str] = re.compile(r"[\-]+")
 
     # Style Flags:
     # https://docs.microsoft.com/en-us/typography/opentype/spec/head
@@ -875,10 +277,35 @@ class Font:
         STYLE_FLAG_EXTENDED: {"bit_head_mac": 6, "bit_os2_fs": None},
     }
     _STYLE_FLAGS_KEYS: list[str] = list(_STYLE_FLAGS.keys())
+    # style flags bits by position (same order of _STYLE_FLAGS_KEYS)
+    _STYLE_FLAGS_BITS_OS2_FS: tuple[int | None, ...] = tuple(
+        bits["bit_os2_fs"] for bits in _STYLE_FLAGS.values()
+    )
+    _STYLE_FLAGS_BITS_HEAD_MAC: tuple[int | None, ...] = tuple(
+        bits["bit_head_mac"] for bits in _STYLE_FLAGS.values()
+    )
+    # style flags values by (lowercase) subfamily name
+    _STYLE_FLAGS_BY_SUBFAMILY_NAME: dict[str, dict[str, bool]] = {
+        STYLE_FLAG_REGULAR: {"regular": True, "bold": False, "italic": False},
+        STYLE_FLAG_BOLD: {"regular": False, "bold": True, "italic": False},
+        STYLE_FLAG_ITALIC: {"regular": False, "bold": False, "italic": True},
+        f"{STYLE_FLAG_BOLD} {STYLE_FLAG_ITALIC}": {
+            "regular": False,
+            "bold": True,
+            "italic": True,
+        },
+    }
 
-    # Unicode blocks/scripts data:
-    _UNICODE_BLOCKS: list[dict[str, Any]] = read_json("data/unicode-blocks.json")
-    _UNICODE_SCRIPTS: list[dict[str, Any]] = read_json("data/unicode-scripts.json")
+    # ASCII control characters codes (C0 controls and DEL):
+    _ASCII_CONTROL_CODES: frozenset[int] = frozenset([*range(0x00, 0x20), 0x7F])
+
+    # Unicode blocks/scripts data (loaded lazily on first use):
+    _UNICODE_BLOCKS: LazyClassAttribute[list[dict[str, Any]]] = LazyClassAttribute(
+        lambda cls: read_json("data/unicode-blocks.json")
+    )
+    _UNICODE_SCRIPTS: LazyClassAttribute[list[dict[str, Any]]] = LazyClassAttribute(
+        lambda cls: read_json("data/unicode-scripts.json")
+    )
 
     # Variable Axes:
     _VARIABLE_AXES: list[dict[str, Any]] = [
@@ -926,9 +353,9 @@ class Font:
         {"tag": "WONK", "name": "Wonky"},
         {"tag": "YEAR", "name": "Year"},
     ]
-    _VARIABLE_AXES_BY_TAG: dict[str, Any] = {
-        axis["tag"]: axis for axis in _VARIABLE_AXES
-    }
+    _VARIABLE_AXES_BY_TAG: Mapping[str, Any] = MappingProxyType(
+        {axis["tag"]: axis for axis in _VARIABLE_AXES}
+    )
 
     # Vertical Metrics:
     VERTICAL_METRIC_UNITS_PER_EM: str = "units_per_em"
@@ -961,6 +388,9 @@ class Font:
         {"table": "OS/2", "attr": "usWinDescent", "key": VERTICAL_METRIC_WIN_DESCENT},
     ]
     # fmt: on
+    _VERTICAL_METRICS_BY_KEY: dict[str, dict[str, Any]] = {
+        metric["key"]: metric for metric in _VERTICAL_METRICS
+    }
 
     # Weights:
     # https://docs.microsoft.com/en-us/typography/opentype/otspec170/os2#usweightclass
@@ -990,9 +420,10 @@ class Font:
         {"value": 900, "name": WEIGHT_BLACK},
         {"value": 950, "name": WEIGHT_EXTRA_BLACK},
     ]
-    _WEIGHTS_BY_VALUE: dict[int, dict[str, Any]] = {
-        weight["value"]: weight for weight in _WEIGHTS
-    }
+    _WEIGHTS_BY_VALUE: Mapping[int, dict[str, Any]] = MappingProxyType(
+        {weight["value"]: weight for weight in _WEIGHTS}
+    )
+    _WEIGHTS_VALUES: tuple[int, ...] = tuple(sorted(_WEIGHTS_BY_VALUE))
 
     # Widths:
     # https://docs.microsoft.com/en-us/typography/opentype/otspec170/os2#uswidthclass
@@ -1014,15 +445,25 @@ class Font:
         {"value": 6, "perc": 112.5, "name": WIDTH_SEMI_EXPANDED},
         {"value": 7, "perc": 125.0, "name": WIDTH_EXPANDED},
         {"value": 8, "perc": 150.0, "name": WIDTH_EXTRA_EXPANDED},
-        {"value": 9, "perc": 200.0, "name": WIDTH_ULTRA_CONDENSED},
+        {"value": 9, "perc": 200.0, "name": WIDTH_ULTRA_EXPANDED},
     ]
-    _WIDTHS_BY_VALUE: dict[int, dict[str, Any]] = {
-        width["value"]: width for width in _WIDTHS
-    }
+    _WIDTHS_BY_VALUE: Mapping[int, dict[str, Any]] = MappingProxyType(
+        {width["value"]: width for width in _WIDTHS}
+    )
+
+    # Instance attributes (no per-instance __dict__):
+    __slots__ = (
+        "_filepath",
+        "_fileobject",
+        "_ttfont",
+        "_kwargs",
+        "_cache",
+        "__weakref__",
+    )
 
     def __init__(
         self,
-        filepath: str | Path | IO | TTFont | Font,
+        filepath: str | Path | IO[bytes] | TTFont | Font,
         **kwargs: Any,
     ) -> None:
         """
@@ -1030,24 +471,34 @@ class Font:
 
         :param filepath: The filepath from which to load the font
         :type filepath: string or file object or TTFont or Font
+        :param kwargs: The options passed to TTFont, by default the font data is read
+            in memory and tables are loaded lazily from it, pass lazy=False to load
+            all tables at once or lazy=True to read them from the file on demand;
+            when a TTFont is given copy=False can be used to wrap it directly
+            instead of copying it (getters values are not cached in this case,
+            so external changes to the TTFont are always reflected)
+        :type kwargs: dict
 
         :raises ValueError: if the filepath is not a valid font
         """
         super().__init__()
 
         self._filepath: str | Path | None = None
-        self._fileobject: IO | None = None
-        self._ttfont: TTFont | None = None
+        self._fileobject: IO[bytes] | None = None
+        self._ttfont: TTFont
         self._kwargs: dict[str, Any] = {}
+        # values computed from the font data, cleared when the font is modified,
+        # None when the wrapped TTFont is exposed (see get_ttfont)
+        self._cache: dict[Any, Any] | None = {}
 
         if isinstance(filepath, (Path, str)):
             self._init_with_filepath(str(filepath), **kwargs)
-        elif hasattr(filepath, "read"):
-            self._init_with_fileobject(filepath, **kwargs)
         elif isinstance(filepath, Font):
             self._init_with_font(filepath, **kwargs)
         elif isinstance(filepath, TTFont):
             self._init_with_ttfont(filepath, **kwargs)
+        elif hasattr(filepath, "read"):
+            self._init_with_fileobject(filepath, **kwargs)
         else:
             filepath_type = type(filepath).__name__
             raise ArgumentError(
@@ -1064,20 +515,34 @@ class Font:
         try:
             self._filepath = filepath
             self._kwargs = kwargs
-            self._ttfont = TTFont(self._filepath, **kwargs)
+            if kwargs.get("lazy") is None:
+                # read the file data in memory (as TTFont does by default),
+                # so the file is not kept open, and load tables lazily from it
+                with open(filepath, "rb") as file:
+                    fontdata = BytesIO(file.read())
+                self._ttfont = TTFont(fontdata, **{**kwargs, "lazy": True})
+            else:
+                self._ttfont = TTFont(self._filepath, **kwargs)
 
         except TTLibError as error:
             raise ArgumentError(f"Invalid font at filepath: '{filepath}'.") from error
 
     def _init_with_fileobject(
         self,
-        fileobject: IO,
+        fileobject: IO[bytes],
         **kwargs: Any,
     ) -> None:
         try:
             self._fileobject = fileobject
             self._kwargs = kwargs
-            self._ttfont = TTFont(self._fileobject, **kwargs)
+            if kwargs.get("lazy") is None:
+                # read the file object data in memory (as TTFont does by default),
+                # so it can be closed, and load tables lazily from it
+                fileobject.seek(0)
+                fontdata = BytesIO(fileobject.read())
+                self._ttfont = TTFont(fontdata, **{**kwargs, "lazy": True})
+            else:
+                self._ttfont = TTFont(self._fileobject, **kwargs)
 
         except TTLibError as error:
             raise ArgumentError(
@@ -1089,17 +554,35 @@ class Font:
         font: Font,
         **kwargs: Any,
     ) -> None:
-        self._init_with_ttfont(font.get_ttfont())
+        if kwargs.get("copy", True):
+            # the other font data is only read, so its cache can be kept
+            self._init_with_ttfont(font._ttfont, **kwargs)
+        else:
+            # the TTFont will be shared, and it could be modified by this font,
+            # get_ttfont disables the other font cache
+            self._init_with_ttfont(font.get_ttfont(), **kwargs)
 
     def _init_with_ttfont(
         self,
         ttfont: TTFont,
+        *,
+        copy: bool = True,
         **kwargs: Any,
     ) -> None:
+        if not copy:
+            # wrap the given TTFont, changes will be shared with it,
+            # it can be modified externally at any time, so nothing is cached
+            self._ttfont = ttfont
+            self._kwargs = kwargs
+            self._disable_cache()
+            return
         self._fileobject = BytesIO()
         ttfont.save(self._fileobject)
-        self._ttfont = TTFont(self._fileobject, **kwargs)
         self._kwargs = kwargs
+        # tables are loaded lazily from a separate in-memory file (sharing the data),
+        # so closing this font doesn't close the file object used by clone()
+        fontdata = BytesIO(self._fileobject.getvalue())
+        self._ttfont = TTFont(fontdata, **{"lazy": True, **kwargs})
 
     def __enter__(
         self,
@@ -1120,7 +603,11 @@ class Font:
         """
         Creates a new Font instance reading the same binary file.
         """
-        return Font(self._filepath or self._fileobject, **self._kwargs)
+        source = self._filepath or self._fileobject
+        if source is None:
+            # wrapped TTFont (not copied), copy its current data
+            return Font(self._ttfont, **self._kwargs)
+        return Font(source, **self._kwargs)
 
     def close(
         self,
@@ -1128,7 +615,7 @@ class Font:
         """
         Close the wrapped TTFont instance.
         """
-        font = self.get_ttfont()
+        font = self._ttfont
         font.close()
 
     @classmethod
@@ -1147,9 +634,15 @@ class Font:
         :rtype: list
         """
         filepath = str(filepath)
-        fonts = []
-        with TTCollection(filepath) as font_collection:
-            fonts = [cls(font, **kwargs) for font in font_collection]
+        with open(filepath, "rb") as file:
+            fontdata = file.read()
+        fonts_count = readTTCHeader(BytesIO(fontdata)).numFonts
+        # each font reads its own tables from the same (shared) collection data,
+        # the font number is kept in kwargs, so it is used also by clone
+        fonts = [
+            cls(BytesIO(fontdata), fontNumber=font_number, **kwargs)
+            for font_number in range(fonts_count)
+        ]
         return fonts
 
     def get_characters(
@@ -1168,27 +661,23 @@ class Font:
 
         :raises TypeError: If it's not possible to find the 'best' unicode cmap dict.
         """
-        font = self.get_ttfont()
-        cmap = font.getBestCmap()
-        if cmap is None:
-            raise DataError("Unable to find the 'best' unicode cmap dict.")
-        glyfs = font.get("glyf")
-        for code, char_name in cmap.items():
+        # local bindings, avoid attribute lookups in the loop
+        get_unicode_name = unicodedata.name
+        get_unicode_block = unicodedata.block
+        get_unicode_script = unicodedata.script
+        get_unicode_script_name = unicodedata.script_name
+        # few distinct scripts per font, resolve each script name once
+        unicode_script_names: dict[str, str] = {}
+        for code, char_name in self._iter_characters_codes(ignore_blank=ignore_blank):
             code_hex = f"{code:04X}"
-            if 0 <= code < 0x110000:
-                char = chr(code)
-            else:
-                continue
-            if ascii.iscntrl(char):
-                continue
-            if glyfs and ignore_blank:
-                glyf = glyfs.get(char_name)
-                if glyf and glyf.numberOfContours == 0:
-                    continue
-            unicode_name = unicodedata.name(char, None)
-            unicode_block_name = unicodedata.block(code)
-            unicode_script_tag = unicodedata.script(code)
-            unicode_script_name = unicodedata.script_name(unicode_script_tag)
+            char = chr(code)
+            unicode_name = get_unicode_name(char, None)
+            unicode_block_name = get_unicode_block(code)
+            unicode_script_tag = get_unicode_script(code)
+            unicode_script_name = unicode_script_names.get(unicode_script_tag)
+            if unicode_script_name is None:
+                unicode_script_name = get_unicode_script_name(unicode_script_tag)
+                unicode_script_names[unicode_script_tag] = unicode_script_name
             yield {
                 "character": char,
                 "character_name": char_name,
@@ -1203,6 +692,29 @@ class Font:
                 "unicode_script_tag": unicode_script_tag,
             }
 
+    def _iter_characters_codes(
+        self,
+        *,
+        ignore_blank: bool = False,
+    ) -> Generator[tuple[int, str], None, None]:
+        # yields the (code, glyph name) of the font characters
+        font = self._ttfont
+        cmap = font.getBestCmap()
+        if cmap is None:
+            raise DataError("Unable to find the 'best' unicode cmap dict.")
+        glyfs = font.get("glyf")
+        check_blank = bool(glyfs and ignore_blank)
+        control_codes = self._ASCII_CONTROL_CODES
+        for code, char_name in cmap.items():
+            # cmap codes are never negative, only the upper bound is checked
+            if code >= 0x110000 or code in control_codes:
+                continue
+            if check_blank:
+                glyf = glyfs.get(char_name)
+                if glyf and glyf.numberOfContours == 0:
+                    continue
+            yield (code, char_name)
+
     def get_characters_count(
         self,
         *,
@@ -1217,25 +729,20 @@ class Font:
         :returns: The characters count.
         :rtype: int
         """
-        return len(list(self.get_characters(ignore_blank=ignore_blank)))
+        return sum(1 for _ in self._iter_characters_codes(ignore_blank=ignore_blank))
 
     def _get_family_classification_items(
         self,
-        class_id: int | str,
-        subclass_id: int | str,
+        class_id: int,
+        subclass_id: int,
     ) -> tuple[dict[str, Any], dict[str, Any]]:
-        classes_list = self._FAMILY_CLASSIFICATIONS["classes"]
-        class_item = find_item(
-            items_list=classes_list,
-            key=lambda item: item.get("id") == class_id,
-        )
-        subclasses_list = class_item.get("subclasses", [])
-        subclass_item = find_item(
-            items_list=subclasses_list,
-            key=lambda item: item.get("id") == subclass_id,
+        class_item, subclasses_by_id = self._FAMILY_CLASSIFICATIONS_BY_ID.get(
+            class_id, ({}, {})
         )
+        subclass_item = subclasses_by_id.get(subclass_id, {})
         return (class_item, subclass_item)
 
+    @cached
     def get_family_classification(
         self,
     ) -> dict[str, Any] | None:
@@ -1254,7 +761,7 @@ class Font:
             }
         :rtype: dict
         """
-        font = self.get_ttfont()
+        font = self._ttfont
         os2 = font.get("OS/2")
         if not os2:
             return None
@@ -1271,14 +778,16 @@ class Font:
         subclass_name = subclass_item.get("name", "")
         full_name = concat_names(class_name, subclass_name, separator=" / ")
 
-        return {
+        family_classification = {
             "full_name": full_name,
             "class_id": class_id,
             "class_name": class_name,
             "subclass_id": subclass_id,
             "subclass_name": subclass_name,
         }
+        return family_classification
 
+    @cached
     def get_family_name(
         self,
     ) -> str:
@@ -1288,12 +797,13 @@ class Font:
         :returns: The font family name.
         :rtype: str
         """
-        return (
+        family_name: str = (
             self.get_name(self.NAME_TYPOGRAPHIC_FAMILY_NAME)
             or self.get_name(self.NAME_WWS_FAMILY_NAME)
             or self.get_name(self.NAME_FAMILY_NAME)
             or ""
         )
+        return family_name
 
     def get_features(
         self,
@@ -1320,17 +830,17 @@ class Font:
         :returns: The features tags list.
         :rtype: list of str
         """
-        font = self.get_ttfont()
-        features_tags = set()
-        for table_tag in ["GPOS", "GSUB"]:
-            if table_tag in font:
-                table = font[table_tag].table
-                try:
-                    feature_record = table.FeatureList.FeatureRecord or []
-                except AttributeError:
-                    feature_record = []
-                for feature in feature_record:
-                    features_tags.add(feature.FeatureTag)
+        font = self._ttfont
+        features_lists = [
+            getattr(font[table_tag].table, "FeatureList", None)
+            for table_tag in ("GPOS", "GSUB")
+            if table_tag in font
+        ]
+        features_tags = {
+            feature.FeatureTag
+            for features_list in features_lists
+            for feature in (getattr(features_list, "FeatureRecord", None) or [])
+        }
         return sorted(features_tags)
 
     def get_filename(
@@ -1359,34 +869,30 @@ class Font:
             family_name = self.get_family_name()
             family_name = remove_spaces(family_name)
             subfamily_name = self.get_name(Font.NAME_SUBFAMILY_NAME) or ""
-            basename = family_name
+            basename_parts = [family_name]
             # append subfamily name
             if subfamily_name.lower() in ("bold", "bold italic", "italic"):
                 subfamily_name = remove_spaces(subfamily_name.lower().title())
-                basename = f"{basename}-{subfamily_name}"
+                basename_parts.append(subfamily_name)
             # append variable suffix
             variable_suffix = (variable_suffix or "").strip()
             if variable_suffix:
-                if variable_suffix.lower() not in basename.lower():
-                    basename = f"{basename}-{variable_suffix}"
+                if variable_suffix.lower() not in "-".join(basename_parts).lower():
+                    basename_parts.append(variable_suffix)
+            basename = "-".join(basename_parts)
             # append axis tags stringified suffix, eg. [wdth,wght,slnt]
             if variable_axes_tags:
                 axes = self.get_variable_axes() or []
-                axes_str_parts = []
-                for axis in axes:
-                    axis_tag = axis["tag"]
-                    axis_str = f"{axis_tag}"
-                    if variable_axes_values:
-                        axis_min_value = int(axis["min_value"])
-                        axis_default_value = int(axis["default_value"])
-                        axis_max_value = int(axis["max_value"])
-                        axis_str += (
-                            f"({axis_min_value},{axis_default_value},{axis_max_value})"
-                        )
-                    axes_str_parts.append(axis_str)
+                if variable_axes_values:
+                    axes_str_parts = [
+                        f"{axis['tag']}({int(axis['min_value'])},"
+                        f"{int(axis['default_value'])},{int(axis['max_value'])})"
+                        for axis in axes
+                    ]
+                else:
+                    axes_str_parts = [f"{axis['tag']}" for axis in axes]
                 axes_str = ",".join(axes_str_parts)
-                axes_str = f"[{axes_str}]"
-                basename = f"{basename}{axes_str}"
+                basename = f"{basename}[{axes_str}]"
         else:
             family_name = self.get_family_name()
             family_name = remove_spaces(family_name)
@@ -1397,6 +903,7 @@ class Font:
         filename = f"{basename}.{extension}"
         return filename
 
+    @cached
     def get_fingerprint(  # type: ignore
         self,
         *,
@@ -1446,7 +953,9 @@ class Font:
         default value: "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789".
         :type text: str
 
-        :returns: A tuple containing the match info (match, diff, hash, other_hash).
+        :returns: A tuple containing the match info (match, diff, hash, other_hash),
+        if one font is variable and the other is not, fingerprints are not computed
+        and (False, None, None, None) is returned.
         :rtype: tuple
         """
         other_font = None
@@ -1460,13 +969,15 @@ class Font:
                 "Invalid other filepath/font: expected str or Font instance, "
                 f"found '{other_type}'."
             )
+        if self.is_variable() != other_font.is_variable():
+            return (False, None, None, None)
         hash = self.get_fingerprint(text=text)
         other_hash = other_font.get_fingerprint(text=text)
         diff = hash - other_hash
         match = diff <= tolerance
-        match = match and self.is_variable() == other_font.is_variable()
         return (match, diff, hash, other_hash)
 
+    @cached
     def get_format(
         self,
         *,
@@ -1481,7 +992,7 @@ class Font:
         :returns: The format.
         :rtype: str
         """
-        font = self.get_ttfont()
+        font = self._ttfont
         version = font.sfntVersion
         flavor = font.flavor
         format_ = ""
@@ -1508,11 +1019,10 @@ class Font:
         :returns: The glyphs.
         :rtype: generator of dicts
         """
-        font = self.get_ttfont()
+        font = self._ttfont
         glyfs = font["glyf"]
-        glyphset = font.getGlyphSet()
-        for name in glyphset.keys():
-            glyf = glyfs[name]
+        # iterate the raw glyphs: getComponentNames doesn't need them expanded
+        for name, glyf in glyfs.glyphs.items():
             yield {
                 "name": name,
                 "components_names": glyf.getComponentNames(glyfs),
@@ -1527,7 +1037,7 @@ class Font:
         :returns: The glyphs count.
         :rtype: int
         """
-        font = self.get_ttfont()
+        font = self._ttfont
         glyphset = font.getGlyphSet()
         count = len(glyphset)
         return count
@@ -1556,21 +1066,32 @@ class Font:
         :returns: The image.
         :rtype: PIL.Image
         """
-        with tempfile.TemporaryDirectory() as dest:
-            filepath = self.save(dest)
-            img = Image.new("RGBA", (2, 2), background_color)
-            draw = ImageDraw.Draw(img)
-            img_font = ImageFont.truetype(filepath, size)
-            img_bbox = draw.textbbox((0, 0), text, font=img_font)
-            img_width = img_bbox[2] - img_bbox[0]
-            img_height = img_bbox[3] - img_bbox[1]
-            img_size = (img_width, img_height)
-            img = img.resize(img_size)
-            draw = ImageDraw.Draw(img)
-            draw.text((-img_bbox[0], -img_bbox[1]), text, font=img_font, fill=color)
-            del img_font
-            return img
-
+        img = Image.new("RGBA", (2, 2), background_color)
+        draw = ImageDraw.Draw(img)
+        img_font = self._get_image_font(size)
+        img_bbox = draw.textbbox((0, 0), text, font=img_font)
+        img_width = img_bbox[2] - img_bbox[0]
+        img_height = img_bbox[3] - img_bbox[1]
+        img_size = (img_width, img_height)
+        img = img.resize(img_size)
+        draw = ImageDraw.Draw(img)
+        draw.text((-img_bbox[0], -img_bbox[1]), text, font=img_font, fill=color)
+        return img
+
+    @cached
+    def _get_image_font(
+        self,
+        size: int,
+    ) -> ImageFont.FreeTypeFont:
+        # loaded from the current font data (not from the filepath)
+        # and cached until the font is modified, so changes made
+        # to the font are always reflected in the rendered images;
+        # the default layout engine is used (raqm, when available)
+        fileobject = self.save_to_fileobject()
+        fileobject.seek(0)
+        return ImageFont.truetype(fileobject, size)
+
+    @cached
     def get_italic_angle(
         self,
     ) -> dict[str, Any] | None:
@@ -1580,7 +1101,7 @@ class Font:
         :returns: The angle value including backslant, italic and roman flags.
         :rtype: dict or None
         """
-        font = self.get_ttfont()
+        font = self._ttfont
         post = font.get("post")
         if not post:
             return None
@@ -1608,6 +1129,29 @@ class Font:
                 f"Invalid key type, expected int or str, found '{key_type}'."
             )
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_name_table_lookup(
+        cls,
+    ) -> dict[int, dict[str, Any]]:
+        # json object keys are strings, convert platform/encoding/language ids to int
+        lookup = read_json("data/name-table-lookup.json")
+        return {
+            int(platform_id): {
+                "name": platform["name"],
+                "encoding": {
+                    int(encoding_id): encoding
+                    for encoding_id, encoding in platform["encoding"].items()
+                },
+                "language": {
+                    int(language_id): language
+                    for language_id, language in platform["language"].items()
+                },
+            }
+            for platform_id, platform in lookup.items()
+        }
+
+    @cached
     def get_name(
         self,
         key: str,
@@ -1623,13 +1167,14 @@ class Font:
 
         :raises KeyError: if the key is not a valid name key/id
         """
-        font = self.get_ttfont()
         name_id = self._get_name_id(key)
+        font = self._ttfont
         name_table = font["name"]
-        name = name_table.getName(name_id, **self._NAMES_MAC_IDS)
-        if not name:
-            name = name_table.getName(name_id, **self._NAMES_WIN_IDS)
-        return str(name.toUnicode()) if name else None
+        name_record = name_table.getName(name_id, **self._NAMES_MAC_IDS)
+        if not name_record:
+            name_record = name_table.getName(name_id, **self._NAMES_WIN_IDS)
+        name = str(name_record.toUnicode()) if name_record else None
+        return name
 
     def get_names(
         self,
@@ -1640,12 +1185,18 @@ class Font:
         :returns: The names.
         :rtype: dict
         """
-        font = self.get_ttfont()
-        names_by_id = {record.nameID: f"{record}" for record in font["name"].names}
+        font = self._ttfont
+        names_by_id = self._NAMES_BY_ID
+        # the last record of each name id wins, decode only that one
+        records_by_key = {}
+        for record in font["name"].names:
+            name = names_by_id.get(record.nameID)
+            if name is not None:
+                records_by_key[name["key"]] = record
+        # same as str(record), without the str/format dispatch
         names = {
-            self._NAMES_BY_ID[name_id]["key"]: value
-            for name_id, value in names_by_id.items()
-            if name_id in self._NAMES_BY_ID
+            key: record.toUnicode(errors="backslashreplace")
+            for key, record in records_by_key.items()
         }
         return names
 
@@ -1658,26 +1209,47 @@ class Font:
         :returns: The names.
         :rtype: dict
         """
-        font = self.get_ttfont()
-        group_by_name_id = {}
+        font = self._ttfont
+        name_table_lookup = self._get_name_table_lookup()
+        # many records share the same platform/encoding/language ids,
+        # resolve each ids combination only once
+        records_info: dict[tuple[int, int, int], dict[str, Any]] = {}
+        group_by_name_id: dict[str, list[dict[str, str]]] = {}
         for record in font["name"].names:
             name_key = self._NAMES_BY_ID.get(record.nameID)
             if not name_key:
                 continue
-            platform = self._NAME_TABLE_LOOKUP.get(record.platformID)
-            encoding = platform.get("encoding").get(record.platEncID)
-            language = platform.get("language").get(record.langID)
-
-            full_name = " - ".join(filter(None, [platform.get("name"), encoding, language]))
-
-            group_by_name_id.setdefault(name_key["key"], [])
-            group_by_name_id[name_key["key"]].append({
-                "name": full_name,
-                "platform": platform.get("name"),
-                "encoding": encoding,
-                "language": language,
-                "value": f"{record}",
-            })
+            record_ids = (record.platformID, record.platEncID, record.langID)
+            record_info = records_info.get(record_ids)
+            if record_info is None:
+                platform = name_table_lookup.get(record.platformID)
+                if platform is None:
+                    # unknown platform id, skip the record
+                    continue
+                # platform items always have "name", "encoding" and "language" keys
+                platform_name = platform["name"]
+                encoding = platform["encoding"].get(record.platEncID)
+                language = platform["language"].get(record.langID)
+
+                full_name = " - ".join(
+                    filter(None, [platform_name, encoding, language])
+                )
+
+                record_info = {
+                    "name": full_name,
+                    "platform": platform_name,
+                    "encoding": encoding,
+                    "language": language,
+                }
+                records_info[record_ids] = record_info
+
+            name_records = group_by_name_id.setdefault(name_key["key"], [])
+            name_records.append(
+                {
+                    **record_info,
+                    "value": record.toUnicode(errors="backslashreplace"),
+                }
+            )
         return group_by_name_id
 
     def get_style_flag(
@@ -1693,24 +1265,10 @@ class Font:
         :returns: The style flag.
         :rtype: bool
         """
-        font = self.get_ttfont()
-        bits = self._STYLE_FLAGS[key]
-        bit_os2_fs = bits["bit_os2_fs"]
-        bit_head_mac = bits["bit_head_mac"]
-        # https://docs.microsoft.com/en-us/typography/opentype/spec/os2#fsselection
-        flag_os2_fs = False
-        if bit_os2_fs is not None:
-            os2 = font.get("OS/2")
-            if os2:
-                flag_os2_fs = get_flag(os2.fsSelection, bit_os2_fs)
-        # https://developer.apple.com/fonts/TrueType-Reference-Manual/RM06/Chap6head.html
-        flag_head_mac = False
-        if bit_head_mac is not None:
-            head = font.get("head")
-            if head:
-                flag_head_mac = get_flag(head.macStyle, bit_head_mac)
-        return flag_os2_fs or flag_head_mac
+        # all the flags are read at once (and cached) by get_style_flags
+        return self.get_style_flags()[key]
 
+    @cached
     def get_style_flags(
         self,
     ) -> dict[str, bool]:
@@ -1720,7 +1278,23 @@ class Font:
         :returns: The dict representing the style flags.
         :rtype: dict
         """
-        return {key: self.get_style_flag(key) for key in self._STYLE_FLAGS_KEYS}
+        font = self._ttfont
+        os2 = font.get("OS/2")
+        head = font.get("head")
+        fs_selection = os2.fsSelection if os2 else 0
+        mac_style = head.macStyle if head else 0
+        bits_os2_fs = self._STYLE_FLAGS_BITS_OS2_FS
+        bits_head_mac = self._STYLE_FLAGS_BITS_HEAD_MAC
+        # https://docs.microsoft.com/en-us/typography/opentype/spec/os2#fsselection
+        # https://developer.apple.com/fonts/TrueType-Reference-Manual/RM06/Chap6head.html
+        flags = {}
+        for index, key in enumerate(self._STYLE_FLAGS_KEYS):
+            bit_os2_fs = bits_os2_fs[index]
+            bit_head_mac = bits_head_mac[index]
+            flags[key] = (
+                bit_os2_fs is not None and get_flag(fs_selection, bit_os2_fs)
+            ) or (bit_head_mac is not None and get_flag(mac_style, bit_head_mac))
+        return flags
 
     def get_style_name(
         self,
@@ -1738,6 +1312,17 @@ class Font:
             or ""
         )
 
+    @staticmethod
+    def _get_svg_number_str(
+        value: float,
+    ) -> str:
+        # svg path coordinates are in font units, 2 decimals are enough
+        # and trailing zeros are dropped, eg. 937.0 -> "937", 452.5 -> "452.5"
+        if isinstance(value, int):
+            return str(value)
+        value_str = f"{value:.2f}".rstrip("0").rstrip(".")
+        return "0" if value_str == "-0" else value_str
+
     def get_svg(
         self,
         *,
@@ -1756,12 +1341,13 @@ class Font:
         :returns: An SVG string that represents the rendered text.
         :rtype: str
         """
-        font = self.get_ttfont()
+        font = self._ttfont
 
         # get font metrics
         units_per_em = font["head"].unitsPerEm
         scale = size / units_per_em
         hhea = font["hhea"]
+        scale_str = f"{scale:.6g}"
         ascent = hhea.ascent * scale
         descent = hhea.descent * scale
         width = 0
@@ -1773,14 +1359,14 @@ class Font:
 
         # generate svg path for each glyph in text
         glyphs: list[str] = list(filter(None, [cmap.get(ord(char)) for char in text]))
-        paths = ""
+        paths: list[str] = []
         for glyph_name in glyphs:
             glyph = glyphset[glyph_name]
-            pen = SVGPathPen(glyphset)
-            glyph.draw(pen)
-            commands = pen.getCommands()
-            transform = f"translate({width:.2f} {ascent:.2f}) scale({scale} -{scale})"
-            paths += f"""<path d="{commands}" transform="{transform}" />"""
+            commands = self._get_glyph_svg_commands(glyph_name)
+            transform = (
+                f"translate({width:.2f} {ascent:.2f}) scale({scale_str} -{scale_str})"
+            )
+            paths.append(f"""<path d="{commands}" transform="{transform}" />""")
             width += glyph.width * scale
 
         # round width and height
@@ -1788,22 +1374,52 @@ class Font:
         height = int(math.ceil(height))
         viewbox = f"0 0 {width} {height}"
         xmlns = "http://www.w3.org/2000/svg"
+        paths_str = "".join(paths)
 
         # generate svg string
-        svg_str = f"""<svg width="{width}" height="{height}" viewBox="{viewbox}" xmlns="{xmlns}">{paths}</svg>"""
+        svg_str = f"""<svg width="{width}" height="{height}" viewBox="{viewbox}" xmlns="{xmlns}">{paths_str}</svg>"""
         return svg_str
 
+    @cached
+    def _get_glyph_svg_commands(
+        self,
+        glyph_name: str,
+    ) -> str:
+        # glyph path commands don't depend on text/size, cached by glyph name
+        font = self._ttfont
+        glyphset = font.getGlyphSet()
+        pen = SVGPathPen(glyphset, ntos=self._get_svg_number_str)
+        glyphset[glyph_name].draw(pen)
+        commands: str = pen.getCommands()
+        return commands
+
     def get_ttfont(
         self,
     ) -> TTFont:
         """
         Gets the wrapped TTFont instance.
+        Once the TTFont has been exposed getters values are not cached anymore,
+        so changes made to it (also through a held reference) are always
+        reflected by the following getters calls.
 
         :returns: The TTFont instance.
         :rtype: TTFont
         """
+        # the TTFont could be modified by the caller at any time
+        self._disable_cache()
         return self._ttfont
 
+    def _disable_cache(
+        self,
+    ) -> None:
+        self._cache = None
+
+    def _clear_cache(
+        self,
+    ) -> None:
+        if self._cache is not None:
+            self._cache.clear()
+
     @classmethod
     def _populate_unicode_items_set(
         cls,
@@ -1811,6 +1427,7 @@ class Font:
         items_cache: dict[str, Any],
         item: dict[str, Any],
     ) -> None:
+        # used by scripts/update_data.py to build the unicode data files
         item_key = item["name"]
         if item_key not in items_cache:
             item = item.copy()
@@ -1820,26 +1437,46 @@ class Font:
         item = items_cache[item_key]
         item["characters_count"] += 1
 
+    @cached
+    def _get_unicode_characters_counts(
+        self,
+    ) -> tuple[Counter[str], Counter[str]]:
+        # characters counts by unicode block name and by unicode script name,
+        # computed (and cached) in a single pass over the font characters
+        get_unicode_block = unicodedata.block
+        get_unicode_script = unicodedata.script
+        blocks_counts: Counter[str] = Counter()
+        scripts_tags_counts: Counter[str] = Counter()
+        for code, _ in self._iter_characters_codes():
+            blocks_counts[get_unicode_block(code)] += 1
+            scripts_tags_counts[get_unicode_script(code)] += 1
+        scripts_counts: Counter[str] = Counter()
+        for script_tag, count in scripts_tags_counts.items():
+            scripts_counts[unicodedata.script_name(script_tag)] += count
+        return (blocks_counts, scripts_counts)
+
     @staticmethod
     def _get_unicode_items_set_with_coverage(
         all_items: list[dict[str, Any]],
-        items: list[dict[str, Any]],
+        characters_counts: Mapping[str, int],
         *,
         coverage_threshold: float = 0.0,
     ) -> list[dict[str, Any]]:
-        all_items = copy.deepcopy(all_items)
-        items_indexed = {item["name"]: item.copy() for item in items}
+        items_filtered = []
         for item in all_items:
-            item_key = item["name"]
-            if item_key in items_indexed:
-                item["characters_count"] = items_indexed[item_key]["characters_count"]
-                item["coverage"] = item["characters_count"] / item["characters_total"]
-            else:
-                item["characters_count"] = 0
-                item["coverage"] = 0.0
-        items_filtered = [
-            item for item in all_items if item["coverage"] >= coverage_threshold
-        ]
+            characters_count = characters_counts.get(item["name"], 0)
+            coverage = (
+                characters_count / item["characters_total"] if characters_count else 0.0
+            )
+            if coverage >= coverage_threshold:
+                # items are flat dicts, a shallow copy of each one is enough
+                items_filtered.append(
+                    {
+                        **item,
+                        "characters_count": characters_count,
+                        "coverage": coverage,
+                    }
+                )
         # items_filtered.sort(key=lambda item: item['name'])
         return items_filtered
 
@@ -1857,8 +1494,9 @@ class Font:
         :rtype: dict or None
         """
         blocks = self.get_unicode_blocks(coverage_threshold=0.0)
+        name_slug = slugify(name)
         for block in blocks:
-            if slugify(name) == slugify(block["name"]):
+            if name_slug == slugify(block["name"]):
                 return block
         # raise KeyError("Invalid unicode block name: '{name}'")
         return None
@@ -1879,15 +1517,9 @@ class Font:
         :returns: The list of unicode blocks.
         :rtype: list of dicts
         """
-        items: list[dict[str, Any]] = []
-        items_cache: dict[str, Any] = {}
-        for char in self.get_characters():
-            item = {
-                "name": char["unicode_block_name"],
-            }
-            self._populate_unicode_items_set(items, items_cache, item)
+        blocks_counts, _ = self._get_unicode_characters_counts()
         blocks = self._get_unicode_items_set_with_coverage(
-            self._UNICODE_BLOCKS, items, coverage_threshold=coverage_threshold
+            self._UNICODE_BLOCKS, blocks_counts, coverage_threshold=coverage_threshold
         )
         return blocks
 
@@ -1905,8 +1537,9 @@ class Font:
         :rtype: dict or None
         """
         scripts = self.get_unicode_scripts(coverage_threshold=0.0)
+        name_slug = slugify(name)
         for script in scripts:
-            if slugify(name) in (slugify(script["name"]), slugify(script["tag"])):
+            if name_slug in (slugify(script["name"]), slugify(script["tag"])):
                 return script
         # raise KeyError("Invalid unicode script name/tag: '{name}'")
         return None
@@ -1927,19 +1560,13 @@ class Font:
         :returns: The list of unicode scripts.
         :rtype: list of dicts
         """
-        items: list[dict[str, Any]] = []
-        items_cache: dict[str, Any] = {}
-        for char in self.get_characters():
-            item = {
-                "name": char["unicode_script_name"],
-                "tag": char["unicode_script_tag"],
-            }
-            self._populate_unicode_items_set(items, items_cache, item)
+        _, scripts_counts = self._get_unicode_characters_counts()
         scripts = self._get_unicode_items_set_with_coverage(
-            self._UNICODE_SCRIPTS, items, coverage_threshold=coverage_threshold
+            self._UNICODE_SCRIPTS, scripts_counts, coverage_threshold=coverage_threshold
         )
         return scripts
 
+    @cached
     def get_variable_axes(
         self,
     ) -> list[dict[str, Any]] | None:
@@ -1951,7 +1578,7 @@ class Font:
         """
         if not self.is_variable():
             return None
-        font = self.get_ttfont()
+        font = self._ttfont
         return [
             {
                 "tag": axis.axisTag,
@@ -1986,6 +1613,7 @@ class Font:
         # raise KeyError("Invalid axis tag: '{tag}'")
         return None
 
+    @cached
     def get_variable_axes_tags(
         self,
     ) -> list[str] | None:
@@ -1997,9 +1625,10 @@ class Font:
         """
         if not self.is_variable():
             return None
-        font = self.get_ttfont()
+        font = self._ttfont
         return [axis.axisTag for axis in font["fvar"].axes]
 
+    @cached
     def get_variable_instances(
         self,
     ) -> list[dict[str, Any]] | None:
@@ -2011,7 +1640,7 @@ class Font:
         """
         if not self.is_variable():
             return None
-        font = self.get_ttfont()
+        font = self._ttfont
         name_table = font["name"]
         return [
             {
@@ -2035,8 +1664,9 @@ class Font:
         :rtype: dict or None
         """
         instances = self.get_variable_instances() or []
+        style_name_slug = slugify(style_name)
         for instance in instances:
-            if slugify(instance["style_name"]) == slugify(style_name):
+            if slugify(instance["style_name"]) == style_name_slug:
                 return instance
         return None
 
@@ -2066,15 +1696,24 @@ class Font:
             if lookup_values.get(axis["tag"]) is None:
                 lookup_values[axis["tag"]] = axis["default_value"]
 
-        instances = self.get_variable_instances() or []
-        closest_instance_distance = float(sys.maxsize)
-        closest_instance = None
-        for instance in instances:
-            instance_values = instance["coordinates"]
-            instance_distance = get_euclidean_distance(instance_values, lookup_values)
-            if instance_distance < closest_instance_distance:
-                closest_instance_distance = instance_distance
-                closest_instance = instance
+        # find the closest fvar instance using only its coordinates,
+        # the style name is read only for the returned instance
+        font = self._ttfont
+        closest_fvar_instance = min(
+            font["fvar"].instances,
+            key=lambda fvar_instance: get_euclidean_distance(
+                fvar_instance.coordinates, lookup_values
+            ),
+            default=None,
+        )
+        if closest_fvar_instance is None:
+            return None
+        closest_instance = {
+            "coordinates": closest_fvar_instance.coordinates,
+            "style_name": font["name"].getDebugName(
+                closest_fvar_instance.subfamilyNameID
+            ),
+        }
         return closest_instance
 
     def get_version(
@@ -2086,11 +1725,12 @@ class Font:
         :returns: The font version value.
         :rtype: float
         """
-        font = self.get_ttfont()
+        font = self._ttfont
         head = font.get("head")
         version = float(head.fontRevision)
         return version
 
+    @cached
     def get_vertical_metrics(
         self,
     ) -> dict[str, Any]:
@@ -2103,7 +1743,7 @@ class Font:
             "win_ascent", "win_descent"
         :rtype: dict
         """
-        font = self.get_ttfont()
+        font = self._ttfont
         metrics = {}
         for metric in self._VERTICAL_METRICS:
             table = font.get(metric["table"])
@@ -2112,6 +1752,7 @@ class Font:
             )
         return metrics
 
+    @cached
     def get_weight(
         self,
     ) -> dict[str, Any] | None:
@@ -2121,24 +1762,54 @@ class Font:
         :returns: The weight name and value.
         :rtype: dict or None
         """
-        font = self.get_ttfont()
+        font = self._ttfont
         os2 = font.get("OS/2")
         if not os2:
             return None
         weight_value = os2.usWeightClass
         weight_value = min(max(1, weight_value), 1000)
-        weight_option_values = sorted(self._WEIGHTS_BY_VALUE.keys())
-        closest_weight_option_value = min(
-            weight_option_values,
-            key=lambda weight_option_value: abs(weight_option_value - weight_value),
-        )
+        # closest weight option value (the lower one in case of tie)
+        weight_option_values = self._WEIGHTS_VALUES
+        index = bisect_left(weight_option_values, weight_value)
+        if index == 0:
+            closest_weight_option_value = weight_option_values[0]
+        elif index == len(weight_option_values):
+            closest_weight_option_value = weight_option_values[-1]
+        else:
+            lower_value = weight_option_values[index - 1]
+            upper_value = weight_option_values[index]
+            closest_weight_option_value = (
+                lower_value
+                if weight_value - lower_value <= upper_value - weight_value
+                else upper_value
+            )
         weight = self._WEIGHTS_BY_VALUE.get(closest_weight_option_value, {}).copy()
         weight["value"] = weight_value
         return weight
 
+    @cached
+    def _get_glyph_bounds_and_area(
+        self,
+        glyphs: str,
+    ) -> tuple[tuple[float, float, float, float] | None, float] | None:
+        # bounds and area of the first available glyph,
+        # cached because both get_glyph_proportions and get_glyph_weight need them
+        font = self._ttfont
+        glyphset = font.getGlyphSet()
+        glyph_name = next(
+            (glyph_name for glyph_name in glyphs if glyph_name in glyphset), None
+        )
+        if glyph_name is None:
+            return None
+        # draw the glyph outline once, feeding both the bounds and the area pens
+        bp = BoundsPen(glyphset)
+        ap = AreaPen(glyphset)
+        glyphset[glyph_name].draw(TeePen(bp, ap))
+        return (bp.bounds, ap.value)
+
     def get_glyph_proportions(
         self,
-        glpyhs="oO"
+        glpyhs: str = "oO",
     ) -> float | None:
         """
         Gets the proportion of the glyph in the font. (Based on the bounding box)
@@ -2148,20 +1819,17 @@ class Font:
         :returns: The proportion of the glyph.
         :rtype: float or None
         """
-        font = self.get_ttfont()
-        glyphset = font.getGlyphSet()
-        for glyph_name in glpyhs:
-            glyph_to_check = glyphset.get(glyph_name)
-            if glyph_to_check:
-                continue
-        if not glyph_to_check:
+        bounds_and_area = self._get_glyph_bounds_and_area(glpyhs)
+        if not bounds_and_area:
+            return None
+        bounds, _ = bounds_and_area
+        if not bounds:
             return None
 
-        bp = BoundsPen(glyphset)
-        glyph_to_check.draw(bp)
-
-        x = bp.bounds[2] - bp.bounds[0]
-        y = bp.bounds[3] - bp.bounds[1]
+        x = bounds[2] - bounds[0]
+        y = bounds[3] - bounds[1]
+        if y <= 0:
+            return None
         proportions = x / y
         if proportions <= 0:
             return None
@@ -2169,7 +1837,7 @@ class Font:
 
     def get_glyph_weight(
         self,
-        glpyhs="oO"
+        glpyhs: str = "oO",
     ) -> float | None:
         """
         Gets the weight of the glyph in the font. (Percentage of the glyph that is filled)
@@ -2179,29 +1847,25 @@ class Font:
         :returns: The proportion of the glyph.
         :rtype: float or None
         """
-        font = self.get_ttfont()
-        glyphset = font.getGlyphSet()
-        for glyph_name in glpyhs:
-            glyph_to_check = glyphset.get(glyph_name)
-            if glyph_to_check:
-                continue
-        if not glyph_to_check:
+        bounds_and_area = self._get_glyph_bounds_and_area(glpyhs)
+        if not bounds_and_area:
+            return None
+        bounds, area = bounds_and_area
+        if not bounds:
             return None
 
-        bp = BoundsPen(glyphset)
-        glyph_to_check.draw(bp)
-
-        x = bp.bounds[2] - bp.bounds[0]
-        y = bp.bounds[3] - bp.bounds[1]
+        x = bounds[2] - bounds[0]
+        y = bounds[3] - bounds[1]
         full_area = x * y
+        if full_area <= 0:
+            return None
 
-        ap = AreaPen(glyphset)
-        glyph_to_check.draw(ap)
-        weight = abs(ap.value) / full_area
+        weight = abs(area) / full_area
         if weight <= 0:
             return None
         return 1 if weight >= 1 else weight
 
+    @cached
     def get_width(
         self,
     ) -> dict[str, Any] | None:
@@ -2211,7 +1875,7 @@ class Font:
         :returns: The width name and value.
         :rtype: dict or None
         """
-        font = self.get_ttfont()
+        font = self._ttfont
         os2 = font.get("OS/2")
         if not os2:
             return None
@@ -2230,12 +1894,9 @@ class Font:
         :returns: True if color font, False otherwise.
         :rtype: bool
         """
-        font = self.get_ttfont()
-        tables = {"COLR", "CPAL", "CBDT", "CBLC"}
-        for table in tables:
-            if table in font:
-                return True
-        return False
+        font = self._ttfont
+        # "tag in font" only checks the tables directory, tables are not loaded
+        return any(tag in font for tag in self._COLOR_TABLES_TAGS)
 
     def is_monospace(
         self,
@@ -2250,23 +1911,54 @@ class Font:
         :returns: True if monospace font, False otherwise.
         :rtype: bool
         """
-        font = self.get_ttfont()
-        widths = [metrics[0] for metrics in font["hmtx"].metrics.values()]
-        widths_counter = Counter(widths)
-        same_width_count = widths_counter.most_common(1)[0][1]
-        same_width_amount = same_width_count / self.get_glyphs_count()
+        font = self._ttfont
+        # hmtx has one metrics entry per glyph, no need to build the glyph set
+        # for counting glyphs
+        hmtx_metrics = font["hmtx"].metrics
+        widths_counter = Counter(metrics[0] for metrics in hmtx_metrics.values())
+        same_width_count = max(widths_counter.values())
+        same_width_amount = same_width_count / len(hmtx_metrics)
         return same_width_amount >= threshold
 
-    def is_all_caps(self):
-        font = self.get_ttfont()
+    def is_all_caps(
+        self,
+    ) -> bool:
+        """
+        Determines if the font is an all caps font,
+        lowercase letters glyphs have the same outlines of the uppercase ones.
+
+        :returns: True if all caps font, False otherwise.
+        :rtype: bool
+        """
+        font = self._ttfont
         glyf_table = font["glyf"]
-        def normalize_glyphs(glyph_name):
-            coordinates = glyf_table[glyph_name].getCoordinates(glyf_table)[0]
-            return [(x[0] - coordinates[0][0], x[1] - coordinates[0][1]) for x in coordinates]
+        cmap = font.getBestCmap() or {}
+
+        def get_glyph_coordinates(char: str) -> Any:
+            glyph_name = cmap.get(ord(char), char)
+            if glyph_name not in glyf_table:
+                return None
+            return glyf_table[glyph_name].getCoordinates(glyf_table)[0]
+
         for letter in string.ascii_lowercase:
-            # Still has false negatives when the path is slightly different
-            if normalize_glyphs(font, letter) != normalize_glyphs(font, letter.upper()):
+            coordinates = get_glyph_coordinates(letter)
+            upper_coordinates = get_glyph_coordinates(letter.upper())
+            if coordinates is None or upper_coordinates is None:
+                return False
+            if len(coordinates) != len(upper_coordinates):
                 return False
+            if not coordinates:
+                continue
+            # compare the outlines translated by the offset of their first points,
+            # still has false negatives when the path is slightly different
+            x0, y0 = coordinates[0]
+            upper_x0, upper_y0 = upper_coordinates[0]
+            offset_x = upper_x0 - x0
+            offset_y = upper_y0 - y0
+            for index, (x, y) in enumerate(coordinates):
+                upper_x, upper_y = upper_coordinates[index]
+                if upper_x - x != offset_x or upper_y - y != offset_y:
+                    return False
         return True
 
     def is_static(
@@ -2289,9 +1981,10 @@ class Font:
         :returns: True if variable font, False otherwise.
         :rtype: bool
         """
-        font = self.get_ttfont()
+        font = self._ttfont
         return "fvar" in font
 
+    @clears_cache
     def rename(
         self,
         *,
@@ -2330,12 +2023,12 @@ class Font:
         subfamily_name = style_name.lower()
         if subfamily_name not in subfamily_names:
             # fix legacy name records 1 and 2
-            family_name_suffix = re.sub(
-                r"\ italic$", "", style_name, flags=re.IGNORECASE
-            )
+            family_name_suffix = self._RENAME_ITALIC_SUFFIX_RE.sub("", style_name)
             if family_name_suffix:
                 family_name = f"{typographic_family_name} {family_name_suffix}"
-            subfamily_name = subfamily_names["italic" in subfamily_name]
+            # the rest of the style moved to the family name,
+            # legacy subfamily name is either "regular" or "italic"
+            subfamily_name = "italic" if "italic" in subfamily_name else "regular"
         subfamily_name = subfamily_name.title()
 
         # full name
@@ -2347,15 +2040,13 @@ class Font:
             remove_spaces(typographic_subfamily_name),
         )
 
-        # keep only printable ASCII subset:
-        # https://learn.microsoft.com/en-us/typography/opentype/spec/name#name-ids
-        # postscript_name_allowed_chars = {chr(code) for code in range(33, 127)}
-        # !"#$&'*+,-.0123456789:;=?@ABCDEFGHIJKLMNOPQRSTUVWXYZ\^_`abcdefghijklmnopqrstuvwxyz|~
-        postscript_name_pattern = (
-            r"[^0-9A-Za-z\!\"\#\$\&\'\*\+\,\-\.\:\;\=\?\@\\\^\_\`\|\~]"
+        # keep only printable ASCII subset
+        postscript_name = self._POSTSCRIPT_NAME_DISALLOWED_CHARS_RE.sub(
+            "-", postscript_name
         )
-        postscript_name = re.sub(postscript_name_pattern, "-", postscript_name)
-        postscript_name = re.sub(r"[\-]+", "-", postscript_name).strip("-")
+        postscript_name = self._POSTSCRIPT_NAME_HYPHENS_RE.sub(
+            "-", postscript_name
+        ).strip("-")
         postscript_name_length = len(postscript_name)
         if postscript_name_length > 63:
             raise ArgumentError(
@@ -2405,34 +2096,39 @@ class Font:
         :return: None
 
         :note: Uses OpenType Sanitizer (ots) to sanitize the font file.
-            Saves the font to a temporary directory and invokes the sanitizer on the saved file.
+            Saves the font to a temporary directory and invokes the sanitizer on the saved file,
+            the result is cached until the font is modified.
             If `strict` is True (default), treats sanitizer warnings as errors.
             If `strict` is False, only checks for sanitizer errors.
         """
+        error_code, warnings, errors = self._get_sanitize_result()
+        if error_code:
+            raise SanitizationError(
+                f"OpenType Sanitizer returned non-zero exit code ({error_code}): \n{errors}"
+            )
+
+        elif strict:
+            success_message = "File sanitized successfully!\n"
+            if warnings != success_message:
+                warnings = warnings.rstrip(success_message)
+                raise SanitizationError(f"OpenType Sanitizer warnings: \n{warnings}")
+
+    @cached
+    def _get_sanitize_result(
+        self,
+    ) -> tuple[int, str, str]:
+        # the result is cached until the font is modified,
+        # so the font is not saved and sanitized again on repeated calls
         with tempfile.TemporaryDirectory() as dest:
-            filename = self.get_filename()
-            filepath = fsutil.join_path(dest, filename)
-            filepath = self.save(filepath)
-            result = ots.sanitize(
+            filepath = fsutil.join_path(dest, self.get_filename())
+            with open(filepath, "wb") as file:
+                self.save_to_fileobject(file)
+            process = ots.sanitize(
                 filepath,
                 capture_output=True,
                 encoding="utf-8",
             )
-            error_code = result.returncode
-            errors = result.stderr
-            if error_code:
-                raise SanitizationError(
-                    f"OpenType Sanitizer returned non-zero exit code ({error_code}): \n{errors}"
-                )
-
-            elif strict:
-                warnings = result.stdout
-                success_message = "File sanitized successfully!\n"
-                if warnings != success_message:
-                    warnings = warnings.rstrip(success_message)
-                    raise SanitizationError(
-                        f"OpenType Sanitizer warnings: \n{warnings}"
-                    )
+        return (process.returncode, process.stdout, process.stderr)
 
     def save(
         self,
@@ -2483,17 +2179,26 @@ class Font:
         filename = fsutil.join_filename(basename, extension)
         filepath = fsutil.join_filepath(dirpath, filename)
         filepath = str(filepath)
-        if fsutil.is_file(filepath) and not overwrite:
+        filepath_exists = fsutil.is_file(filepath)
+        if filepath_exists and not overwrite:
             raise ArgumentError(
                 f"Invalid filepath, a file already exists at '{filepath}' "
                 "and 'overwrite' option is 'False' (consider using 'overwrite=True')."
             )
-        fsutil.make_dirs_for_file(filepath)
-
-        font = self.get_ttfont()
-        font.save(filepath)
+        if not filepath_exists:
+            # the parent directories exist already when overwriting a file
+            fsutil.make_dirs_for_file(filepath)
+
+        font = self._ttfont
+        # compile the font in memory before opening (and truncating) the file,
+        # lazy fonts may still read tables from it when overwriting the source
+        fontdata = BytesIO()
+        font.save(fontdata)
+        with open(filepath, "wb") as file:
+            file.write(fontdata.getbuffer())
         return filepath
 
+    @clears_cache
     def _save_with_flavor(
         self,
         *,
@@ -2501,7 +2206,7 @@ class Font:
         filepath: str | Path | None = None,
         overwrite: bool = True,
     ) -> str:
-        font = self.get_ttfont()
+        font = self._ttfont
         presave_flavor = font.flavor
         font.flavor = flavor
         # save
@@ -2562,8 +2267,8 @@ class Font:
 
     def save_to_fileobject(
         self,
-        fileobject: IO | None = None,
-    ) -> IO:
+        fileobject: IO[bytes] | None = None,
+    ) -> IO[bytes]:
         """
         Writes the font to a file-like object. If no file-object is passed, an
         instance of `BytesIO` is created for the user.
@@ -2573,7 +2278,7 @@ class Font:
         instance.
         :rtype: typing.io.IO
         """
-        font = self.get_ttfont()
+        font = self._ttfont
         if fileobject is None:
             fileobject = BytesIO()
         font.save(fileobject)
@@ -2586,6 +2291,8 @@ class Font:
         woff2: bool = True,
         woff: bool = True,
         overwrite: bool = True,
+        max_workers: int = 1,
+        remove_overlaps: bool = True,
         **options: Any,
     ) -> list[dict[str, Any]]:
         """
@@ -2599,6 +2306,13 @@ class Font:
         :type woff: bool
         :param overwrite: Whether to overwrite existing files in the directory. Default is True.
         :type overwrite: bool
+        :param max_workers: The max number of worker processes used for generating
+            the instances in parallel. Default is 1 (no worker processes).
+        :type max_workers: int
+        :param remove_overlaps: Whether to remove the instances glyphs overlaps. Default is True.
+            Overlaps removal is the slowest step, when False the overlaps are kept
+            and flagged (rendered correctly by most environments, eg. browsers).
+        :type remove_overlaps: bool
         :param options: Additional options to be passed to the instancer when generating static instances.
         :type options: dictionary
 
@@ -2614,45 +2328,148 @@ class Font:
         fsutil.assert_not_file(dirpath)
         fsutil.make_dirs(dirpath)
 
+        options["remove_overlaps"] = remove_overlaps
         instances_format = self.get_format()
-        instances_saved = []
+        instances_saved: list[dict[str, Any]] = []
+        # get_variable_instances returns new dicts, no need to copy them
         instances = self.get_variable_instances() or []
-        for instance in instances:
-            # make instance
-            instance_font = self.clone()
+        save_options: dict[str, Any] = {
+            "dirpath": dirpath,
+            "instances_format": instances_format,
+            "woff2": woff2,
+            "woff": woff,
+            "overwrite": overwrite,
+        }
+        with tempfile.TemporaryDirectory() as tempdir:
+            # the current font data is saved once to a temporary file,
+            # each instance is generated starting from it (reading it lazily,
+            # workers share the os page cache instead of receiving a copy of it)
+            font_filepath = fsutil.join_path(tempdir, "font")
+            with open(font_filepath, "wb") as file:
+                self.save_to_fileobject(file)
+            save_instance = partial(
+                self._save_variable_instance,
+                font_filepath=font_filepath,
+                instancer_options=options,
+                save_options=save_options,
+            )
+            if max_workers > 1 and len(instances) > 1:
+                # instancing is cpu-bound, each instance is generated and saved
+                # in a worker process
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    for instance in instances:
+                        instance_saved: dict[str, Any] = {}
+                        instance_saved["files"] = executor.submit(
+                            save_instance, instance
+                        )
+                        instance_saved["instance"] = instance
+                        instances_saved.append(instance_saved)
+            else:
+                # woff/woff2 compression (zlib/brotli) releases the GIL,
+                # so webfonts are written in background threads while
+                # the next instances are being generated
+                with ThreadPoolExecutor() as thread_executor:
+                    for instance in instances:
+                        instance_saved = {}
+                        instance_saved["files"] = save_instance(
+                            instance, submit=thread_executor.submit
+                        )
+                        instance_saved["instance"] = instance
+                        instances_saved.append(instance_saved)
+        # collect files filepaths (and raise errors, if any)
+        for instance_saved in instances_saved:
+            instance_files = instance_saved["files"]
+            if isinstance(instance_files, Future):
+                instance_files = instance_saved["files"] = instance_files.result()
+            for format_, value in instance_files.items():
+                if isinstance(value, Future):
+                    instance_files[format_] = value.result()
+        return instances_saved
+
+    @classmethod
+    def _save_variable_instance(
+        cls,
+        instance: dict[str, Any],
+        *,
+        font_filepath: str,
+        instancer_options: dict[str, Any],
+        save_options: dict[str, Any],
+        submit: Callable[..., Future[str]] | None = None,
+    ) -> dict[str, Any]:
+        # generates and saves an instance (also in a worker process),
+        # see save_variable_instances
+        with cls(font_filepath, lazy=True) as instance_font:
             instance_font.to_static(
                 coordinates=instance["coordinates"],
-                **options,
+                **instancer_options,
             )
             instance_font.rename(
                 style_name=instance["style_name"],
             )
-            instance_files: dict[str, Any] = {
-                Font.FORMAT_OTF: None,
-                Font.FORMAT_TTF: None,
-                Font.FORMAT_WOFF2: None,
-                Font.FORMAT_WOFF: None,
-            }
-            instance_files[instances_format] = instance_font.save(
-                dirpath,
-                overwrite=overwrite,
+            return cls._save_variable_instance_files(
+                instance_font,
+                submit=submit,
+                **save_options,
             )
-            if woff2 and not instance_files[Font.FORMAT_WOFF2]:
-                instance_files[Font.FORMAT_WOFF2] = instance_font.save_as_woff2(
-                    dirpath,
+
+    @classmethod
+    def _save_variable_instance_files(
+        cls,
+        instance_font: Font,
+        *,
+        dirpath: str | Path,
+        instances_format: str,
+        woff2: bool,
+        woff: bool,
+        overwrite: bool,
+        submit: Callable[..., Future[str]] | None = None,
+    ) -> dict[str, Any]:
+        # saves the instance font and its webfonts (in background, if submit is given)
+        instance_files: dict[str, Any] = {
+            Font.FORMAT_OTF: None,
+            Font.FORMAT_TTF: None,
+            Font.FORMAT_WOFF2: None,
+            Font.FORMAT_WOFF: None,
+        }
+        instance_filepath = instance_font.save(
+            dirpath,
+            overwrite=overwrite,
+        )
+        instance_files[instances_format] = instance_filepath
+        for flavor, enabled in [
+            (Font.FORMAT_WOFF2, woff2),
+            (Font.FORMAT_WOFF, woff),
+        ]:
+            if enabled and not instance_files[flavor]:
+                save_file_with_flavor = partial(
+                    cls._save_file_with_flavor,
+                    instance_filepath,
+                    flavor=flavor,
+                    dirpath=dirpath,
                     overwrite=overwrite,
                 )
-            if woff and not instance_files[Font.FORMAT_WOFF]:
-                instance_files[Font.FORMAT_WOFF] = instance_font.save_as_woff(
-                    dirpath,
-                    overwrite=overwrite,
+                instance_files[flavor] = (
+                    submit(save_file_with_flavor) if submit else save_file_with_flavor()
                 )
-            instance_saved = {}
-            instance_saved["files"] = instance_files.copy()
-            instance_saved["instance"] = instance.copy()
-            instances_saved.append(instance_saved)
-        return instances_saved
+        return instance_files
+
+    @staticmethod
+    def _save_file_with_flavor(
+        filepath: str,
+        *,
+        flavor: str,
+        dirpath: str | Path,
+        overwrite: bool,
+    ) -> str:
+        # each call uses its own Font instance, so it is safe to run in a thread
+        with Font(filepath) as font:
+            return font._save_with_flavor(
+                flavor=flavor,
+                filepath=dirpath,
+                overwrite=overwrite,
+            )
 
+    @clears_cache
     def set_family_classification(
         self,
         class_id: int,
@@ -2667,7 +2484,7 @@ class Font:
         :raises OperationError: If the OS/2 table is not available in the font.
         :raises ArgumentError: If class_id is invalid or subclass_id is specified but invalid.
         """
-        font = self.get_ttfont()
+        font = self._ttfont
         os2 = font.get("OS/2")
         if not os2:
             raise OperationError("Invalid OS/2 table (doesn't exist).")
@@ -2683,13 +2500,11 @@ class Font:
         if not subclass_item and subclass_id:
             raise ArgumentError("Invalid subclass key argument.")
 
-        class_id = class_item["id"]
-        if subclass_item:
-            subclass_id = subclass_item["id"]
-
-        family_class = (class_id << 8) | (subclass_id & 0xFF)
-        os2.sFamilyClass = family_class
+        # items are looked up by id, so class_id and subclass_id are already valid
+        family_class = FamilyClassification(class_id, subclass_id)
+        os2.sFamilyClass = family_class.to_int()
 
+    @clears_cache
     def set_family_name(
         self,
         name: str,
@@ -2705,6 +2520,7 @@ class Font:
             style_name=self.get_style_name(),
         )
 
+    @clears_cache
     def set_name(
         self,
         key: int | str,
@@ -2718,13 +2534,14 @@ class Font:
         :param value: The value
         :type value: str
         """
-        font = self.get_ttfont()
+        font = self._ttfont
         name_id = self._get_name_id(key)
         name_table = font["name"]
         # https://github.com/fonttools/fonttools/blob/main/Lib/fontTools/ttLib/tables/_n_a_m_e.py#L568
         name_table.setName(value, name_id, **self._NAMES_MAC_IDS)
         name_table.setName(value, name_id, **self._NAMES_WIN_IDS)
 
+    @clears_cache
     def set_names(
         self,
         names: dict[str, str],
@@ -2735,9 +2552,39 @@ class Font:
         :param names: The names
         :type names: dict
         """
+        font = self._ttfont
+        name_table = font["name"]
+        # index the name records once instead of scanning them
+        # for each name set (as name_table.setName does),
+        # the first record for each key is the one updated by setName
+        records_by_key: dict[tuple[int, int, int, int], Any] = {}
+        for record in getattr(name_table, "names", []):
+            record_key = (
+                record.nameID,
+                record.platformID,
+                record.platEncID,
+                record.langID,
+            )
+            records_by_key.setdefault(record_key, record)
         for key, value in names.items():
-            self.set_name(key, value)
-
+            name_id = self._get_name_id(key)
+            for ids in (self._NAMES_MAC_IDS, self._NAMES_WIN_IDS):
+                record_key = (
+                    name_id,
+                    ids["platformID"],
+                    ids["platEncID"],
+                    ids["langID"],
+                )
+                record = records_by_key.get(record_key)
+                if record and isinstance(value, str):
+                    record.string = value
+                else:
+                    # new record or non-str value (type-checked/decoded by setName)
+                    name_table.setName(value, name_id, **ids)
+                    if not record:
+                        records_by_key[record_key] = name_table.names[-1]
+
+    @clears_cache
     def set_style_flag(
         self,
         key: str,
@@ -2751,7 +2598,7 @@ class Font:
         :param value: The value
         :type value: bool
         """
-        font = self.get_ttfont()
+        font = self._ttfont
         bits = self._STYLE_FLAGS[key]
         bit_os2_fs = bits["bit_os2_fs"]
         bit_head_mac = bits["bit_head_mac"]
@@ -2764,6 +2611,7 @@ class Font:
             if head:
                 head.macStyle = set_flag(head.macStyle, bit_head_mac, value)
 
+    @clears_cache
     def set_style_flags(
         self,
         *,
@@ -2797,12 +2645,31 @@ class Font:
         :type extended: bool or None
         """
         flags = locals()
-        flags.pop("self")
-        for key, value in flags.items():
-            if value is not None:
-                assert isinstance(value, bool)
-                self.set_style_flag(key, value)
-
+        font = self._ttfont
+        os2 = font.get("OS/2")
+        head = font.get("head")
+        fs_selection = os2.fsSelection if os2 else 0
+        mac_style = head.macStyle if head else 0
+        bits_os2_fs = self._STYLE_FLAGS_BITS_OS2_FS
+        bits_head_mac = self._STYLE_FLAGS_BITS_HEAD_MAC
+        # compute the new fsSelection / macStyle values, then write them once
+        for index, key in enumerate(self._STYLE_FLAGS_KEYS):
+            value = flags[key]
+            if value is None:
+                continue
+            assert isinstance(value, bool)
+            bit_os2_fs = bits_os2_fs[index]
+            if bit_os2_fs is not None:
+                fs_selection = set_flag(fs_selection, bit_os2_fs, value)
+            bit_head_mac = bits_head_mac[index]
+            if bit_head_mac is not None:
+                mac_style = set_flag(mac_style, bit_head_mac, value)
+        if os2:
+            os2.fsSelection = fs_selection
+        if head:
+            head.macStyle = mac_style
+
+    @clears_cache
     def set_style_flags_by_subfamily_name(
         self,
     ) -> None:
@@ -2812,15 +2679,11 @@ class Font:
         to allow this method to work properly.
         """
         subfamily_name = (self.get_name(Font.NAME_SUBFAMILY_NAME) or "").lower()
-        if subfamily_name == Font.STYLE_FLAG_REGULAR:
-            self.set_style_flags(regular=True, bold=False, italic=False)
-        elif subfamily_name == Font.STYLE_FLAG_BOLD:
-            self.set_style_flags(regular=False, bold=True, italic=False)
-        elif subfamily_name == Font.STYLE_FLAG_ITALIC:
-            self.set_style_flags(regular=False, bold=False, italic=True)
-        elif subfamily_name == f"{Font.STYLE_FLAG_BOLD} {Font.STYLE_FLAG_ITALIC}":
-            self.set_style_flags(regular=False, bold=True, italic=True)
+        flags = self._STYLE_FLAGS_BY_SUBFAMILY_NAME.get(subfamily_name)
+        if flags:
+            self.set_style_flags(**flags)
 
+    @clears_cache
     def set_style_name(
         self,
         name: str,
@@ -2836,6 +2699,7 @@ class Font:
             style_name=name,
         )
 
+    @clears_cache
     def set_vertical_metrics(
         self,
         **metrics: Any,
@@ -2848,13 +2712,16 @@ class Font:
             "typo_ascender", "typo_descender", "typo_line_gap", "cap_height", "x_height",
             "win_ascent", "win_descent"
         """
-        font = self.get_ttfont()
-        for metric in self._VERTICAL_METRICS:
-            if metric["key"] in metrics:
+        font = self._ttfont
+        metrics_by_key = self._VERTICAL_METRICS_BY_KEY
+        for key, value in metrics.items():
+            metric = metrics_by_key.get(key)
+            if metric:
                 table = font.get(metric["table"])
                 if table:
-                    setattr(table, metric["attr"], metrics[metric["key"]])
+                    setattr(table, metric["attr"], value)
 
+    @clears_cache
     def subset(
         self,
         *,
@@ -2877,7 +2744,7 @@ class Font:
         :param options: The subsetter options
         :type options: dict
         """
-        font = self.get_ttfont()
+        font = self._ttfont
         if not any([unicodes, glyphs, text]):
             raise ArgumentError(
                 "Subsetting requires at least one of "
@@ -2919,6 +2786,26 @@ class Font:
             for axis_value in axes.values()
         )
 
+    @staticmethod
+    def _get_sliced_axis_value(
+        axis_value: Any,
+        axis: dict[str, Any],
+    ) -> Any:
+        """
+        Converts a list/dict axis value to the tuple used by the instancer,
+        missing dict values fallback to the axis min/default/max values.
+        """
+        if isinstance(axis_value, list):
+            return tuple(axis_value)
+        if isinstance(axis_value, dict):
+            return (
+                axis_value.get("min", axis.get("min_value")),
+                axis_value.get("default", axis.get("default_value")),
+                axis_value.get("max", axis.get("max_value")),
+            )
+        return axis_value
+
+    @clears_cache
     def to_sliced_variable(
         self,
         *,
@@ -2947,27 +2834,21 @@ class Font:
         if not self.is_variable():
             raise OperationError("Only a variable font can be sliced.")
 
-        font = self.get_ttfont()
-        coordinates = coordinates or {}
-        coordinates_axes_tags = coordinates.keys()
+        font = self._ttfont
+        axes_by_tag = {axis["tag"]: axis for axis in self.get_variable_axes() or []}
 
         # make coordinates more friendly accepting also list and dict values
-        for axis_tag in coordinates_axes_tags:
-            axis_value = coordinates[axis_tag]
-            if isinstance(axis_value, list):
-                axis_value = tuple(axis_value)
-            elif isinstance(axis_value, dict):
-                axis = self.get_variable_axis_by_tag(axis_tag) or {}
-                axis_min = axis_value.get("min", axis.get("min_value"))
-                axis_default = axis_value.get("default", axis.get("default_value"))
-                axis_max = axis_value.get("max", axis.get("max_value"))
-                axis_value = (axis_min, axis_default, axis_max)
-            coordinates[axis_tag] = axis_value
+        coordinates = {
+            axis_tag: self._get_sliced_axis_value(
+                axis_value, axes_by_tag.get(axis_tag, {})
+            )
+            for axis_tag, axis_value in (coordinates or {}).items()
+        }
 
         # ensure that coordinates axes are defined and that are not all pinned
-        if len(coordinates_axes_tags) == 0:
+        if len(coordinates) == 0:
             raise ArgumentError("Invalid coordinates: axes not defined.")
-        elif set(coordinates_axes_tags) == set(self.get_variable_axes_tags() or []):
+        elif coordinates.keys() == axes_by_tag.keys():
             if self._all_axes_pinned(coordinates):
                 raise ArgumentError(
                     "Invalid coordinates: all axes are pinned (use to_static method)."
@@ -2981,6 +2862,7 @@ class Font:
         # instantiate the sliced variable font
         instancer.instantiateVariableFont(font, coordinates, inplace=True, **options)
 
+    @clears_cache
     def to_static(
         self,
         *,
@@ -2988,6 +2870,7 @@ class Font:
         style_name: str | None = None,
         update_names: bool = True,
         update_style_flags: bool = True,
+        remove_overlaps: bool = True,
         **options: Any,
     ) -> None:
         """
@@ -3004,6 +2887,9 @@ class Font:
         :type update_names: bool
         :param update_style_flags: if True the style flags will be updated based on closest instance
         :type update_style_flags: bool
+        :param remove_overlaps: if True the glyphs overlaps will be removed, otherwise they
+            will be kept and flagged (faster, the 'overlap' option takes precedence)
+        :type remove_overlaps: bool
 
         :param options: The options for the fontTools.varLib.instancer
         :type options: dictionary
@@ -3014,7 +2900,7 @@ class Font:
         if not self.is_variable():
             raise OperationError("Only a variable font can be made static.")
 
-        font = self.get_ttfont()
+        font = self._ttfont
 
         # take coordinates from instance with specified style name
         if style_name:
@@ -3048,7 +2934,10 @@ class Font:
         # set default instancer options
         options["inplace"] = True
         options.setdefault("optimize", True)
-        options.setdefault("overlap", OverlapMode.REMOVE)
+        options.setdefault(
+            "overlap",
+            OverlapMode.REMOVE if remove_overlaps else OverlapMode.KEEP_AND_SET_FLAGS,
+        )
         options.setdefault("updateFontNames", False)
 
         # instantiate the static font
@@ -8,5 +8,5 @@ def get_euclidean_distance(
     b: dict[str, float],
 ) -> float:
     # https://en.wikipedia.org/wiki/Euclidean_distance#Higher_dimensions
-    keys = set(list(a.keys()) + list(b.keys()))
-    return math.sqrt(sum([math.pow(a.get(key, 0) - b.get(key, 0), 2) for key in keys]))
+    keys = a.keys() | b.keys()
+    return math.hypot(*(a.get(key, 0) - b.get(key, 0) for key in keys))
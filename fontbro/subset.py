@@ -3,27 +3,52 @@ from __future__ import annotations
 import re
 
 from collections.abc import Iterable
+from functools import lru_cache
 
 from fontTools.subset import parse_unicodes as _parse_unicodes
 
+# possible — ‐ − (&mdash; &dash; &minus;)
+_DASHES_RE = re.compile(r"[\—\‐\−]")
+# U+, \u, u prefixes
+_PREFIXES_RE = re.compile(r"(U\+)|(\\u)|(u)", flags=re.I)
+
 
 def parse_unicodes(
     unicodes: Iterable[int | str] | str,
 ) -> list[int]:
+    codes: set[int] = set()
     if isinstance(unicodes, (list, set, tuple)):
-        # convert possible int codepoints to hex str
-        unicodes_list = list(unicodes)
-        for index, code in enumerate(unicodes_list):
-            unicodes_list[index] = f"{code:04X}" if isinstance(code, int) else code
-        unicodes_str = ",".join(list(set(unicodes_list)))
+        # int codepoints are kept as they are,
+        # only str items (codes and ranges) need to be parsed
+        strs: set[str] = set()
+        for code in unicodes:
+            if isinstance(code, int):
+                codes.add(code)
+            else:
+                strs.add(code)
+        unicodes_str = ",".join(sorted(strs))
     elif isinstance(unicodes, str):
         unicodes_str = unicodes
     else:
         raise ValueError("Invalid 'unicodes' value.")
     assert isinstance(unicodes_str, str)
+    if not unicodes_str:
+        return list(codes)
+    # the same specs are usually parsed for many fonts,
+    # the cached tuple is copied to a new list for each caller
+    unicodes_list = list(_parse_unicodes_str(unicodes_str))
+    if codes:
+        # int codepoints may also be included in the parsed str items
+        unicodes_list = list(dict.fromkeys([*codes, *unicodes_list]))
+    return unicodes_list
+
+
+@lru_cache(maxsize=128)
+def _parse_unicodes_str(
+    unicodes_str: str,
+) -> tuple[int, ...]:
     # replace possible — ‐ − (&mdash; &dash; &minus;) with -
-    unicodes_str = re.sub(r"[\—\‐\−]", "-", unicodes_str)
+    unicodes_str = _DASHES_RE.sub("-", unicodes_str)
     # remove U+, \u, u if present
-    unicodes_str = re.sub(r"(U\+)|(\\u)|(u)", "", unicodes_str, flags=re.I)
-    unicodes_list = _parse_unicodes(unicodes_str)
-    return unicodes_list
+    unicodes_str = _PREFIXES_RE.sub("", unicodes_str)
+    return tuple(_parse_unicodes(unicodes_str))
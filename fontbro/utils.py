@@ -1,10 +1,105 @@
 from __future__ import annotations
 import re
 import unicodedata
-from typing import Any, Callable
+from functools import lru_cache, wraps
+from typing import Any, Callable, Generic, TypeVar
 
 import fsutil
 
+T = TypeVar("T")
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class LazyClassAttribute(Generic[T]):
+    """
+    Class attribute computed by factory(cls) on first access,
+    the computed value then replaces the descriptor in the class __dict__.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[Any], T],
+    ) -> None:
+        self._factory = factory
+        self._name = ""
+
+    def __set_name__(
+        self,
+        owner: type,
+        name: str,
+    ) -> None:
+        self._name = name
+
+    def __get__(
+        self,
+        instance: Any,
+        owner: type,
+    ) -> T:
+        value = self._factory(owner)
+        setattr(owner, self._name, value)
+        return value
+
+
+def cached(
+    method: F,
+) -> F:
+    """
+    Decorator for methods that only read the instance data,
+    the result is stored in self._cache (keyed by the method name and arguments)
+    and a copy of it is returned, so callers can't alter the cached value;
+    if self._cache is None (caching disabled) the method is always called.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(
+        self: Any,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        cache = self._cache
+        if cache is None:
+            return method(self, *args, **kwargs)
+        key = (name, args, tuple(sorted(kwargs.items()))) if args or kwargs else name
+        if key not in cache:
+            cache[key] = method(self, *args, **kwargs)
+        return _copy_cached_value(cache[key])
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _copy_cached_value(
+    value: Any,
+) -> Any:
+    if isinstance(value, dict):
+        return value.copy()
+    if isinstance(value, list):
+        return [_copy_cached_value(item) for item in value]
+    return value
+
+
+def clears_cache(
+    method: F,
+) -> F:
+    """
+    Decorator for methods that modify the instance data,
+    it calls self._clear_cache() before and after the method call.
+    """
+
+    @wraps(method)
+    def wrapper(
+        self: Any,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        self._clear_cache()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._clear_cache()
+
+    return wrapper  # type: ignore[return-value]
+
 
 def concat_names(
     a: str,
@@ -26,6 +121,7 @@ def find_item(
     )
 
 
+@lru_cache(maxsize=None)
 def read_json(
     filepath: str,
 ) -> Any:
@@ -38,13 +134,21 @@ def remove_spaces(
     return s.replace(" ", "")
 
 
+_SLUGIFY_SEPARATORS_RE = re.compile(r"[\s_]+")
+# delete ascii chars other than letters, digits, "_" and "-" (same as [^\w\-])
+_SLUGIFY_DISALLOWED_CHARS_TABLE = str.maketrans(
+    "",
+    "",
+    "".join(chr(code) for code in range(128) if not re.match(r"[\w\-]", chr(code))),
+)
+
+
 def slugify(
     s: str,
 ) -> str:
     s = unicodedata.normalize("NFKD", s)
     s = s.encode("ascii", "ignore").decode("ascii")
     s = s.lower()
-    s = re.sub(r"[\s_]+", "-", s)
-    s = re.sub(r"[^\w\-]", "", s)
-    s = s.strip("-")
-    return s.lower().strip().replace(" ", "-")
+    s = _SLUGIFY_SEPARATORS_RE.sub("-", s)
+    s = s.translate(_SLUGIFY_DISALLOWED_CHARS_TABLE)
+    return s.strip("-")
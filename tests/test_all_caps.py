@@ -0,0 +1,26 @@
+from tests import AbstractTestCase
+
+
+class AllCapsTestCase(AbstractTestCase):
+    """
+    This class describes an all caps test case.
+    """
+
+    def test_is_all_caps(self):
+        with self._get_font("/Inter/static/Inter-Regular.ttf") as font:
+            self.assertFalse(font.is_all_caps())
+        with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
+            self.assertFalse(font.is_all_caps())
+
+    def test_is_all_caps_with_lowercase_mapped_to_uppercase_glyphs(self):
+        with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
+            ttfont = font.get_ttfont()
+            for table in ttfont["cmap"].tables:
+                if table.isUnicode():
+                    for code in range(ord("a"), ord("z") + 1):
+                        table.cmap[code] = table.cmap[code - 32]
+            self.assertTrue(font.is_all_caps())
+
+    def test_is_all_caps_without_lowercase_glyphs(self):
+        with self._get_font("/issues/issue-0048/test.ttf") as font:
+            self.assertFalse(font.is_all_caps())
@@ -1,3 +1,5 @@
+from fontTools.ttLib import TTFont
+
 from fontbro import Font
 from tests import AbstractTestCase
 
@@ -45,3 +47,12 @@ class CloneTestCase(AbstractTestCase):
         font_clone = font2.clone()
         self.assertFalse(font2 == font_clone)
         self.assertEqual(f"{font2}", f"{font_clone}")
+
+    def test_clone_with_ttfont_then_close(self):
+        filepath = self._get_font_path("/Noto_Sans_TC/NotoSansTC-Regular.otf")
+        font = Font(TTFont(filepath))
+        font_clone = font.clone()
+        font.close()
+        self.assertEqual(font_clone.get_family_name(), "Noto Sans TC")
+        font_clone_after_close = font.clone()
+        self.assertEqual(font_clone_after_close.get_family_name(), "Noto Sans TC")
@@ -1,6 +1,7 @@
 from tests import AbstractTestCase
 
 # import fsutil
+from fontbro import Font
 from fontbro.exceptions import ArgumentError
 
 
@@ -109,3 +110,12 @@ class FamilyClassificationTestCase(AbstractTestCase):
         with self._get_font("/issues/issue-0052/Bobbiefreebie.ttf") as font:
             with self.assertRaises(ArgumentError):
                 font.set_family_classification(class_id=1, subclass_id=16)
+
+    def test_family_classification_constants(self):
+        self.assertEqual(Font.FAMILY_CLASSIFICATION_SANS_SERIF, {"class_id": 8})
+        self.assertEqual(
+            Font.FAMILY_CLASSIFICATION_SCRIPTS_CALLIGRAPHIC,
+            {"class_id": 10, "subclass_id": 5},
+        )
+        self.assertIn("subclass_id", Font.FAMILY_CLASSIFICATION_SCRIPTS_CALLIGRAPHIC)
+        self.assertNotIn("subclass_id", Font.FAMILY_CLASSIFICATION_SANS_SERIF)
@@ -23,3 +23,10 @@ class FamilyNameTestCase(AbstractTestCase):
         self.assertEqual(
             names[Font.NAME_UNIQUE_IDENTIFIER], "3.000;GOOG;RobotoMonoNew-Regular"
         )
+
+    def test_family_name_after_ttfont_change(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        self.assertEqual(font.get_family_name(), "Roboto Mono")
+        ttfont = font.get_ttfont()
+        ttfont["name"].setName("Roboto Mono Changed", 16, 3, 1, 0x409)
+        self.assertEqual(font.get_family_name(), "Roboto Mono Changed")
@@ -105,6 +105,9 @@ class FingerprintTestCase(AbstractTestCase):
             other=font_b, tolerance=10
         )
         self.assertFalse(match)
+        self.assertEqual(diff, None)
+        self.assertEqual(hash, None)
+        self.assertEqual(other_hash, None)
 
     def test_get_fingerprint_match_with_other_font_filepath(self):
         font_a = self._get_font("/Tourney/Tourney-VariableFont_wdth,wght.ttf")
@@ -25,3 +25,21 @@ class GlyphsTestCase(AbstractTestCase):
             self.assertEqual(glyphs_count, 999)
             characters_count = font.get_characters_count()
             self.assertTrue(glyphs_count > characters_count)
+
+    def test_get_glyph_proportions(self):
+        with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
+            # the first available glyph is used
+            proportions = font.get_glyph_proportions()
+            self.assertEqual(proportions, font.get_glyph_proportions("o"))
+            self.assertNotEqual(proportions, font.get_glyph_proportions("O"))
+            self.assertEqual(font.get_glyph_proportions("-o"), proportions)
+            self.assertEqual(font.get_glyph_proportions("-"), None)
+
+    def test_get_glyph_weight(self):
+        with self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf") as font:
+            # the first available glyph is used
+            weight = font.get_glyph_weight()
+            self.assertEqual(weight, font.get_glyph_weight("o"))
+            self.assertNotEqual(weight, font.get_glyph_weight("O"))
+            self.assertTrue(0 < weight < 1)
+            self.assertEqual(font.get_glyph_weight("-"), None)
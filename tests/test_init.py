@@ -21,6 +21,13 @@ class InitTestCase(AbstractTestCase):
         filepath = dirpath / Path("Noto_Sans_TC/NotoSansTC-Regular.otf")
         Font(filepath=filepath)
 
+    def test_init_with_filepath_does_not_keep_file_open(self):
+        filepath = self._get_font_path("/Noto_Sans_TC/NotoSansTC-Regular.otf")
+        font = Font(filepath=filepath)
+        # font data read in memory, tables loaded lazily from it
+        self.assertIsInstance(font.get_ttfont().reader.file, BytesIO)
+        self.assertEqual(font.get_family_name(), "Noto Sans TC")
+
     def test_init_with_file_object(self):
         filepath = self._get_font_path("/Noto_Sans_TC/NotoSansTC-Regular.otf")
         with open(filepath, "rb") as fh:
@@ -54,7 +61,38 @@ class InitTestCase(AbstractTestCase):
         font1 = Font(ttfont)
         Font(font1.get_ttfont())
 
+    def test_init_with_ttfont_without_copy(self):
+        filepath = self._get_font_path("/Noto_Sans_TC/NotoSansTC-Regular.otf")
+        ttfont = TTFont(filepath)
+        font = Font(ttfont, copy=False)
+        self.assertIs(font.get_ttfont(), ttfont)
+        font_clone = font.clone()
+        self.assertIsNot(font_clone.get_ttfont(), ttfont)
+        self.assertEqual(font_clone.get_family_name(), font.get_family_name())
+
+    def test_init_with_ttfont_without_copy_and_external_changes(self):
+        filepath = self._get_font_path("/Noto_Sans_TC/NotoSansTC-Regular.otf")
+        ttfont = TTFont(filepath)
+        font = Font(ttfont, copy=False)
+        self.assertEqual(font.get_family_name(), "Noto Sans TC")
+        self.assertEqual(font.get_weight()["value"], 400)
+        ttfont["name"].setName("Renamed", 1, 3, 1, 0x409)
+        ttfont["name"].removeNames(nameID=16)
+        ttfont["OS/2"].usWeightClass = 700
+        self.assertEqual(font.get_family_name(), "Renamed")
+        self.assertEqual(font.get_weight()["value"], 700)
+
     def test_init_with_fontbro_font(self):
         filepath = self._get_font_path("/Noto_Sans_TC/NotoSansTC-Regular.otf")
         font1 = Font(filepath)
         Font(font1)
+
+    def test_init_with_fontbro_font_without_copy(self):
+        filepath = self._get_font_path("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        font1 = Font(filepath)
+        self.assertEqual(font1.get_family_name(), "Roboto Mono")
+        font2 = Font(font1, copy=False)
+        font2.rename(family_name="Changed")
+        self.assertEqual(font1.get_family_name(), "Changed")
+        font1.rename(family_name="Changed Again")
+        self.assertEqual(font2.get_family_name(), "Changed Again")
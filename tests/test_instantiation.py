@@ -131,6 +131,20 @@ class InstantiationTestCase(AbstractTestCase):
         )
         self.assertFalse(font.get_style_flag("italic"))
 
+    def test_to_static_with_remove_overlaps_default(self):
+        font = self._get_variable_font()
+        font.to_static()
+        glyph = font.get_ttfont()["glyf"]["A"]
+        # OVERLAP_SIMPLE flag not set, overlaps have been removed
+        self.assertFalse(glyph.flags[0] & 0x40)
+
+    def test_to_static_without_remove_overlaps(self):
+        font = self._get_variable_font()
+        font.to_static(remove_overlaps=False)
+        glyph = font.get_ttfont()["glyf"]["A"]
+        # OVERLAP_SIMPLE flag set, overlaps have been kept
+        self.assertTrue(glyph.flags[0] & 0x40)
+
     def test_to_sliced_variable_with_static_font(self):
         font = self._get_static_font()
         with self.assertRaises(TypeError):
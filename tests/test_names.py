@@ -58,11 +58,44 @@ class NamesTestCase(AbstractTestCase):
         self.assertEqual(font_names["full_name"], "Roboto Mono Regular")
         self.assertEqual(font_names["postscript_name"], "RobotoMono-Regular")
 
+    def test_get_all_names(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        all_names = font.get_all_names()
+        self.assertEqual(
+            all_names["family_name"],
+            [
+                {
+                    "name": "Windows - Unicode BMP - en-US",
+                    "platform": "Windows",
+                    "encoding": "Unicode BMP",
+                    "language": "en-US",
+                    "value": "Roboto Mono",
+                }
+            ],
+        )
+
+    def test_get_all_names_with_unknown_platform(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        name_table = font.get_ttfont()["name"]
+        name_table.setName("Unknown Platform Name", 1, 99, 0, 0)
+        all_names = font.get_all_names()
+        family_names = [item["value"] for item in all_names["family_name"]]
+        self.assertEqual(family_names, ["Roboto Mono"])
+
     def test_set_name(self):
         font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
         font.set_name(Font.NAME_FAMILY_NAME, "Roboto Mono Renamed")
         self.assertEqual(font.get_name(Font.NAME_FAMILY_NAME), "Roboto Mono Renamed")
 
+    def test_set_name_after_get_name(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        self.assertEqual(font.get_name(Font.NAME_FAMILY_NAME), "Roboto Mono")
+        font.set_name(Font.NAME_FAMILY_NAME, "Roboto Mono Renamed")
+        self.assertEqual(font.get_name(Font.NAME_FAMILY_NAME), "Roboto Mono Renamed")
+        ttfont = font.get_ttfont()
+        ttfont["name"].setName("Roboto Mono Changed", 1, 3, 1, 0x409)
+        self.assertEqual(font.get_name(Font.NAME_FAMILY_NAME), "Roboto Mono Changed")
+
     def test_set_name_by_invalid_key(self):
         font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
         with self.assertRaises(KeyError):
@@ -80,3 +113,8 @@ class NamesTestCase(AbstractTestCase):
         self.assertEqual(family_name, "Roboto Mono Renamed")
         subfamily_name = font.get_name(Font.NAME_SUBFAMILY_NAME)
         self.assertEqual(subfamily_name, "Regular Renamed")
+
+    def test_set_names_with_invalid_value(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        with self.assertRaises(TypeError):
+            font.set_names({Font.NAME_FAMILY_NAME: None})
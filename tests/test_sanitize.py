@@ -1,6 +1,7 @@
 import fsutil
 
 from fontbro import Font
+from fontbro.exceptions import SanitizationError
 from tests import AbstractTestCase
 
 
@@ -75,3 +76,11 @@ class SanitizeTestCase(AbstractTestCase):
             strict=True,
             expected_errors_count=2,  # should reduce to 0
         )
+
+    def test_sanitize_after_font_change(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        font.sanitize()
+        font.sanitize()
+        del font.get_ttfont()["OS/2"]
+        with self.assertRaises(SanitizationError):
+            font.sanitize()
@@ -184,6 +184,89 @@ class SaveTestCase(AbstractTestCase):
             ],
         )
 
+    def test_save_variable_instances_with_max_workers(self):
+        font = self._get_font("/Roboto_Mono/RobotoMono-VariableFont_wght.ttf")
+        output_dirpath = self._get_font_temp_path("test_save_variable_instances")
+        saved_fonts = font.save_variable_instances(
+            output_dirpath,
+            woff2=True,
+            woff=True,
+            overwrite=True,
+            max_workers=2,
+        )
+        saved_instances = [saved_font["instance"] for saved_font in saved_fonts]
+        self.assertEqual(saved_instances, font.get_variable_instances())
+
+        for saved_font in saved_fonts:
+            saved_files = saved_font["files"]
+            self.assertEqual(saved_files["otf"], None)
+            for format_ in ["ttf", "woff2", "woff"]:
+                self.assertTrue(fsutil.is_file(saved_files[format_]))
+
+        saved_files_ttf = [
+            fsutil.get_filename(saved_font["files"]["ttf"])
+            for saved_font in saved_fonts
+        ]
+        self.assertEqual(
+            saved_files_ttf,
+            [
+                "RobotoMono-Thin.ttf",
+                "RobotoMono-Light.ttf",
+                "RobotoMono-Regular.ttf",
+                "RobotoMono-Medium.ttf",
+                "RobotoMono-Bold.ttf",
+            ],
+        )
+        saved_font = Font(saved_fonts[-1]["files"]["woff2"])
+        self.assertEqual(saved_font.get_style_name(), "Bold")
+        self.assertTrue(saved_font.is_static())
+
+    def test_save_variable_instances_after_font_change_with_and_without_max_workers(
+        self,
+    ):
+        font = self._get_font("/Roboto_Mono/RobotoMono-VariableFont_wght.ttf")
+        font.rename(family_name="Renamed Family")
+        saved_files_by_max_workers = {}
+        for max_workers in [1, 2]:
+            output_dirpath = self._get_font_temp_path(
+                f"test_save_variable_instances_{max_workers}"
+            )
+            saved_fonts = font.save_variable_instances(
+                output_dirpath,
+                woff2=False,
+                woff=False,
+                overwrite=True,
+                max_workers=max_workers,
+            )
+            saved_files_by_max_workers[max_workers] = [
+                saved_font["files"]["ttf"] for saved_font in saved_fonts
+            ]
+        saved_files = saved_files_by_max_workers[1]
+        saved_files_parallel = saved_files_by_max_workers[2]
+        self.assertEqual(
+            [fsutil.get_filename(filepath) for filepath in saved_files],
+            [
+                "RenamedFamily-Thin.ttf",
+                "RenamedFamily-Light.ttf",
+                "RenamedFamily-Regular.ttf",
+                "RenamedFamily-Medium.ttf",
+                "RenamedFamily-Bold.ttf",
+            ],
+        )
+        self.assertEqual(
+            [fsutil.get_filename(filepath) for filepath in saved_files],
+            [fsutil.get_filename(filepath) for filepath in saved_files_parallel],
+        )
+        for filepath, filepath_parallel in zip(saved_files, saved_files_parallel):
+            ttfont = Font(filepath).get_ttfont()
+            ttfont_parallel = Font(filepath_parallel).get_ttfont()
+            self.assertEqual(sorted(ttfont.keys()), sorted(ttfont_parallel.keys()))
+            for tag in ttfont.reader.keys():
+                if tag == "head":
+                    # contains the modified timestamp
+                    continue
+                self.assertEqual(ttfont.reader[tag], ttfont_parallel.reader[tag])
+
     def test_save_variable_instances_with_static_font(self):
         font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
         output_dirpath = self._get_font_temp_path("")
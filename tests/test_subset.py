@@ -1,3 +1,4 @@
+from fontbro.subset import parse_unicodes
 from tests import AbstractTestCase
 
 
@@ -67,6 +68,10 @@ class SubsetTestCase(AbstractTestCase):
         chars_count = font.get_characters_count()
         self.assertEqual(chars_count, 240)
 
+    def test_parse_unicodes_with_list_of_int_and_str(self):
+        self.assertEqual(parse_unicodes([65, "0041"]), [65])
+        self.assertEqual(sorted(parse_unicodes([66, "0041-0043"])), [65, 66, 67])
+
     def test_subset_with_unicodes_list_of_int(self):
         font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
         chars_count = font.get_characters_count()
@@ -51,3 +51,22 @@ class WeightTestCase(AbstractTestCase):
         del font.get_ttfont()["OS/2"]
         weight = font.get_weight()
         self.assertEqual(weight, None)
+
+    def test_get_weight_after_ttfont_change(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        weight = font.get_weight()
+        self.assertEqual(weight, {"value": 400, "name": Font.WEIGHT_REGULAR})
+        weight["value"] = 0
+        self.assertEqual(font.get_weight()["value"], 400)
+        ttfont = font.get_ttfont()
+        ttfont["OS/2"].usWeightClass = 700
+        self.assertEqual(font.get_weight(), {"value": 700, "name": Font.WEIGHT_BOLD})
+
+    def test_get_weight_after_held_ttfont_change(self):
+        font = self._get_font("/Roboto_Mono/static/RobotoMono-Regular.ttf")
+        ttfont = font.get_ttfont()
+        self.assertEqual(font.get_weight()["value"], 400)
+        ttfont["OS/2"].usWeightClass = 900
+        self.assertEqual(font.get_weight(), {"value": 900, "name": Font.WEIGHT_BLACK})
+        ttfont["OS/2"].usWeightClass = 700
+        self.assertEqual(font.get_weight(), {"value": 700, "name": Font.WEIGHT_BOLD})
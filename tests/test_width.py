@@ -52,3 +52,10 @@ class WidthTestCase(AbstractTestCase):
         del font.get_ttfont()["OS/2"]
         width = font.get_width()
         self.assertEqual(width, None)
+
+    def test_get_width_ultra_expanded(self):
+        font = self._get_font("/Noto_Sans_TC/NotoSansTC-Regular.otf")
+        font.get_ttfont()["OS/2"].usWidthClass = 9
+        width = font.get_width()
+        expected_width = {"value": 9, "perc": 200.0, "name": Font.WIDTH_ULTRA_EXPANDED}
+        self.assertEqual(width, expected_width)